@@ -1,6 +1,6 @@
 # remap/config.py
 from __future__ import annotations
-import json, os
+import atexit, json, os, time
 from typing import Dict, Any
 
 from pathlib import Path
@@ -15,7 +15,7 @@ CONFIG_PATH = os.path.join(PACKAGE_DIR, "config.json")
 
 DEFAULT_CFG: Dict[str, Any] = {
     "pins": {"CIRCLE": 17, "CROSS": 27, "SQUARE": 22, "TRIANGLE": 23},
-    "display": {"fullscreen": True, "fps": 60, "windowed_size": [720, 1280]},
+    "display": {"fullscreen": True, "fps": 60, "windowed_size": [720, 1280], "partial_update": True},
     "speedup": {"target_time_initial": 3, "target_time_min": 0.45, "target_time_step": -0.03},
     "timed": {"duration": 60.0, "rule_bonus": 5.0},
     "rules": {"every_hits": 10, "banner_sec": 2.0, "banner_font_center": 64, "banner_font_pinned": 40},
@@ -91,6 +91,29 @@ def save_config(partial_cfg: dict) -> None:
     except Exception:
         pass
 
+# Deferred writes: event handlers queue patches, the main loop writes them out in one go so
+# no disk I/O happens inside input handling. Queued patches are merged in order.
+CONFIG_FLUSH_MIN_INTERVAL = 1.0   # s between two deferred writes
+_pending_cfg: Dict[str, Any] = {}
+_last_flush = 0.0
+
+def queue_config(partial_cfg: dict) -> None:
+    _merge(_pending_cfg, _deepcopy(partial_cfg))
+
+def flush_config(*, force: bool = False) -> None:
+    global _last_flush
+    if not _pending_cfg:
+        return
+    now = time.monotonic()
+    if not force and now - _last_flush < CONFIG_FLUSH_MIN_INTERVAL:
+        return
+    _last_flush = now
+    patch = dict(_pending_cfg)
+    _pending_cfg.clear()
+    save_config(patch)
+
+atexit.register(flush_config, force=True)
+
 def load_config() -> dict:
     cfg = _deepcopy(DEFAULT_CFG)
     try:
@@ -112,11 +135,8 @@ def load_config() -> dict:
     return cfg
 
 def persist_windowed_size(width: int, height: int) -> None:
-    try:
-        cfg = load_config()
-        cfg.setdefault("display", {})["windowed_size"] = [int(width), int(height)]
-        save_config({"display": {"windowed_size": cfg["display"]["windowed_size"]}})
-    except Exception:
-        pass
+    # same bounds _sanitize_cfg applies on load; no need to re-read the whole file per resize
+    w, h = max(200, min(10000, int(width))), max(200, min(10000, int(height)))
+    queue_config({"display": {"windowed_size": [w, h]}})
 
 CFG = load_config()
@@ -26,6 +26,8 @@ SYMBOL_COLORS = {
 PADDING = 0.06                   
 GAP = 0.04                       
 FPS = int(CFG.get("display", {}).get("fps", 60))    
+PARTIAL_UPDATE = bool(CFG.get("display", {}).get("partial_update", True))  # present only changed rects in gameplay/tutorials
+PARTIAL_UPDATE_MAX_AREA = 0.5     # fall back to a full flip when dirty rects cover more of the screen than this
 INPUT_ACCEPT_DELAY = 0.03
 TEXT_SHADOW_OFFSET = (2, 2)
 UI_RADIUS = 8
@@ -137,6 +139,14 @@ RULE_PANEL_PAD = 16
 RULE_BANNER_VGAP = 8              
 RULE_BANNER_TITLE = "REMAPPING:"   
 RULE_BANNER_PIN_SCALE = 0.65      
+RULE_PANEL_CACHE_MAX = 32         # rendered rule panels kept (LRU)
+RULE_PANEL_SHADOW_OFFSET = (3, 5) # drop shadow offset baked into the panel composite
+TEXT_CACHE_MAX = 128              # rendered unscaled text surfaces kept by draw_text (LRU)
+FONT_CACHE_MAX = 64               # loaded Font objects by (path, size, style); trimmed on font rebuild
+BG_CACHE_MAX = 4                  # cover-scaled backgrounds kept per window size (LRU)
+RING_LAYER_CACHE_MAX = 16         # static ring layer surfaces kept by InputRing (cleared when full)
+GLYPH_CACHE_MAX = 96              # rasterized symbol/arrow glyphs kept per size (LRU)
+RULE_PANEL_SCALE_STEP = 0.01      # panel/symbol scales snap to this grid so animated frames share cache entries
 RULE_SYMBOL_SCALE_CENTER = 1.00   
 RULE_SYMBOL_SCALE_PINNED = 0.70   
 RULE_BANNER_MIN_W_FACTOR = 0.90   
@@ -174,7 +184,12 @@ MOD_COLOR = {
     "random":  (90, 220, 255),   # cyan
 }
 
-RING_POSITIONS = ["TOP", "RIGHT", "LEFT", "BOTTOM"]
+# Modifier id -> chip colour ("joystick" chips use the inverted-joystick colour)
+MOD_COLOR_ALIASED = {**MOD_COLOR, "joystick": MOD_COLOR["invert"]}
+
+RING_POSITIONS = ("TOP", "RIGHT", "LEFT", "BOTTOM")
+# Unit screen direction from the ring centre to each position
+RING_DIR_VEC = {"TOP": (0, -1), "RIGHT": (1, 0), "LEFT": (-1, 0), "BOTTOM": (0, 1)}
 
 RING_PALETTES = {
     "clean-white":   {"base": (243,244,246), "hi": (255,255,255), "soft": (209,213,219)},
@@ -187,6 +202,9 @@ RING_PALETTES = {
 
 # Gradient order used when cycling palettes automatically
 RING_GRADIENT_ORDER = ["clean-white", "electric-blue", "neon-cyan", "violet-neon", "magenta"]
+# (base, hi, soft) per palette, and the auto-gradient stops in order
+RING_PALETTE_TRIPLES = {name: (p["base"], p["hi"], p["soft"]) for name, p in RING_PALETTES.items()}
+RING_GRADIENT = tuple(RING_PALETTE_TRIPLES[name] for name in RING_GRADIENT_ORDER)
 
 # --- Aspect ratio ------------------------------------------------------------
 ASPECT_RATIO = (9, 16)             
@@ -0,0 +1,38 @@
+﻿from __future__ import annotations
+
+import time
+
+# Sleep only while more than this is left; the rest is spun so the frame lands on time.
+# OS sleeps overshoot by ~1 ms, which is what makes pygame.time.Clock pacing jitter.
+SPIN_WINDOW_SEC = 0.002
+
+
+class FramePacer:
+    """Frame limiter on perf_counter; drop-in for ``pygame.time.Clock.tick``."""
+
+    def __init__(self) -> None:
+        self._next = time.perf_counter()
+        self._last = self._next
+
+    def tick(self, fps: int = 0) -> int:
+        """Wait until the next frame slot and return the ms since the previous tick."""
+        now = time.perf_counter()
+        if fps > 0:
+            period = 1.0 / fps
+            target = self._next
+            slack = target - now
+            if slack > SPIN_WINDOW_SEC:
+                time.sleep(slack - SPIN_WINDOW_SEC * 0.5)
+            while time.perf_counter() < target:
+                time.sleep(0)  # yield the GIL (GPIO callback thread) while spinning
+            now = time.perf_counter()
+            # fixed cadence; after a long frame restart from now instead of bursting to catch up
+            self._next = target + period if target + period > now else now + period
+        else:
+            self._next = now
+        elapsed = now - self._last
+        self._last = now
+        return int(elapsed * 1000)
+
+
+__all__ = ["FramePacer"]
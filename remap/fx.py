@@ -1,5 +1,6 @@
 ﻿from __future__ import annotations
 from typing import Optional, Dict, Tuple
+import math
 import random as _rand
 import pygame
 
@@ -8,6 +9,7 @@ import pygame
 # Screen glitch
 GLITCH_DURATION = 0.20             # s
 GLITCH_PIXEL_FACTOR_MAX = 0.10     # 0..1 controls the downsample strength
+GLITCH_SMOOTH_MIN_STRENGTH = 0.5   # below this the downsample is nearest instead of smoothscale
 
 # Text glitch
 TEXT_GLITCH_DURATION = 0.5
@@ -36,10 +38,42 @@ PULSE_KIND_DURATION = {
     "score":  0.26,
     "timer":  0.40,
 }
+# One bit per pulse channel for the active-pulse mask
+PULSE_BITS = {
+    "symbol": 1 << 0,
+    "streak": 1 << 1,
+    "banner": 1 << 2,
+    "score":  1 << 3,
+    "timer":  1 << 4,
+}
+
+_TAU = 2.0 * math.pi
 
 # Exit-slide animation duration
 EXIT_SLIDE_SEC = 0.12
 
+# Ease-out-cubic sampled once; ease_out_cubic() reads the nearest sample
+EASE_LUT_SIZE = 1024
+_EASE_OUT_CUBIC_LUT = tuple(1.0 - (1.0 - i / (EASE_LUT_SIZE - 1)) ** 3 for i in range(EASE_LUT_SIZE))
+# sin(pi * t) on the same grid: the bump shape shared by all pulse curves
+_SIN_PI_LUT = tuple(math.sin(math.pi * i / (EASE_LUT_SIZE - 1)) for i in range(EASE_LUT_SIZE))
+# peak overshoot (max_scale - 1) per pulse kind
+_PULSE_AMP = {k: PULSE_BASE_MAX_SCALE * PULSE_KIND_SCALE.get(k, 1.0) - 1.0 for k in PULSE_BITS}
+
+
+def ease_out_cubic(t: float) -> float:
+    if t <= 0.0:
+        return 0.0
+    if t >= 1.0:
+        return 1.0
+    return _EASE_OUT_CUBIC_LUT[int(t * (EASE_LUT_SIZE - 1) + 0.5)]
+
+
+def _sin_pi(t: float) -> float:
+    if t <= 0.0 or t >= 1.0:
+        return 0.0
+    return _SIN_PI_LUT[int(t * (EASE_LUT_SIZE - 1) + 0.5)]
+
 # Tryb glitch
 from .enums import GlitchMode
 
@@ -48,6 +82,11 @@ class EffectsManager:
     def __init__(self, now_fn, *, glitch_mode: GlitchMode = GlitchMode.BOTH):
         self.now = now_fn
 
+        # per-frame clock: set by begin_frame() for the duration of a draw, None otherwise
+        self._frame_now: Optional[float] = None
+        self._frame_id = 0
+        self._pulse_cache: Dict[str, float] = {}  # pulse_scale results for the current frame
+
         # easing
         self.easing_default = "in_out"
         self._easing_map: Dict[str, callable] = {}
@@ -68,6 +107,10 @@ class EffectsManager:
         self.glitch_active_until = 0.0
         self.glitch_start_time = 0.0
         self.glitch_mag = 1.0
+        self._small_buf: Optional[pygame.Surface] = None  # pixelation scratch (frame-sized, used via subsurface)
+        self._pixel_buf: Optional[pygame.Surface] = None  # upscaled pixelation output
+        self._split_base: Optional[pygame.Surface] = None  # RGB split: unshifted source
+        self._chan_buf: Optional[pygame.Surface] = None    # RGB split: one masked channel
 
         # text glitch
         self.text_glitch_active_until = 0.0
@@ -81,6 +124,7 @@ class EffectsManager:
             'score':  (0.0, 0.0),
             'timer':  (0.0, 0.0),
         }
+        self._active_mask = 0  # PULSE_BITS of pulses that have not expired yet
         self._ring_pulses: Dict[str, Tuple[float, float]] = {}
 
         # exit slide
@@ -109,9 +153,7 @@ class EffectsManager:
         t = self._clamp01(t)
         return t * t * (3.0 - 2.0 * t)
 
-    def _ease_out_cubic(self, t: float) -> float:
-        t = self._clamp01(t)
-        return 1.0 - (1.0 - t) ** 3
+    _ease_out_cubic = staticmethod(ease_out_cubic)
 
     def _ease_in_cubic(self, t: float) -> float:
         t = self._clamp01(t)
@@ -141,6 +183,20 @@ class EffectsManager:
     def menu_slide_sec(self) -> float:
         return self.get_timing("menu_slide_sec", 0.30)
 
+    # ---------- frame clock ----------
+    def begin_frame(self, now: float) -> None:
+        """Freeze the clock for queries until end_frame(); triggers keep using the live clock."""
+        self._frame_now = now
+        self._frame_id += 1
+        self._pulse_cache.clear()
+
+    def end_frame(self) -> None:
+        self._frame_now = None
+
+    def _query_now(self) -> float:
+        now = self._frame_now
+        return self.now() if now is None else now
+
     # ---------- tryb glitch ----------
     def set_glitch_mode(self, mode: GlitchMode):
         self.screen_glitch = mode in (GlitchMode.SCREEN, GlitchMode.BOTH)
@@ -154,6 +210,8 @@ class EffectsManager:
         self.glitch_mag = 1.0
         self.text_glitch_active_until = 0.0
         self._pulses = {k: (0.0, 0.0) for k in self._pulses}
+        self._active_mask = 0
+        self._pulse_cache.clear()
         self._ring_pulses.clear()
 
     # ---------- triggers ----------
@@ -188,7 +246,10 @@ class EffectsManager:
             self.trigger_text_glitch()
 
     def is_text_glitch_active(self) -> bool:
-        return self.text_glitch and (self.now() < self.text_glitch_active_until)
+        return self.text_glitch and (self._query_now() < self.text_glitch_active_until)
+
+    def is_screen_glitch_active(self) -> bool:
+        return self.screen_glitch and (self._query_now() < self.glitch_active_until)
 
     def trigger_pulse(self, kind: str, duration: float | None = None):
         if kind not in self._pulses:
@@ -196,6 +257,8 @@ class EffectsManager:
         dur = float(duration if duration is not None else PULSE_KIND_DURATION.get(kind, PULSE_BASE_DURATION))
         now = self.now()
         self._pulses[kind] = (now, now + max(1e-3, dur))
+        self._active_mask |= PULSE_BITS[kind]
+        self._pulse_cache.pop(kind, None)
 
     def trigger_pulse_symbol(self): self.trigger_pulse('symbol')
     def trigger_pulse_streak(self): self.trigger_pulse('streak')
@@ -211,53 +274,77 @@ class EffectsManager:
         self._ring_pulses[key] = (now, now + max(1e-3, dur))
 
     def ring_pulse_scale(self, key: str) -> float:
-        st, en = self._ring_pulses.get(key, (0.0, 0.0))
-        if st <= 0.0 or self.now() >= en:
+        # queried for every ring icon each frame; usually nothing is pulsing at all
+        pulse = self._ring_pulses.get(key)
+        if pulse is None:
+            return 1.0
+        st, en = pulse
+        now = self._query_now()
+        if now >= en:
+            del self._ring_pulses[key]  # expired: later queries take the lookup-miss path
+            return 1.0
+        if st <= 0.0:
             return 1.0
         dur = max(1e-6, en - st)
-        t = (self.now() - st) / dur
-        import math
+        t = (now - st) / dur
         # subtle pop
         local_max = 1.14
-        return 1.0 + (local_max - 1.0) * math.sin(math.pi * max(0.0, min(1.0, t)))
+        return 1.0 + (local_max - 1.0) * _sin_pi(t)
 
     # ---------- queries / math ----------
     def _pulse_curve01(self, t: float, kind: str) -> float:
-        import math
-        t = max(0.0, min(1.0, t))
-        kscale = float(PULSE_KIND_SCALE.get(kind, 1.0))
-        max_scale = float(PULSE_BASE_MAX_SCALE) * kscale
-        return 1.0 + (max_scale - 1.0) * math.sin(math.pi * t)
+        amp = _PULSE_AMP.get(kind)
+        if amp is None:
+            amp = PULSE_BASE_MAX_SCALE * PULSE_KIND_SCALE.get(kind, 1.0) - 1.0
+        return 1.0 + amp * _sin_pi(t)
 
     def pulse_scale(self, kind: str) -> float:
-        start, until = self._pulses.get(kind, (0.0, 0.0))
-        if start <= 0.0:
+        bit = PULSE_BITS.get(kind, 0)
+        if not (self._active_mask & bit):
             return 1.0
-        now = self.now()
+        if self._frame_now is not None:
+            cached = self._pulse_cache.get(kind)
+            if cached is not None:
+                return cached
+        start, until = self._pulses[kind]
+        now = self._query_now()
         if now >= until:
+            self._active_mask &= ~bit
             return 1.0
         dur = max(1e-6, until - start)
         t = (now - start) / dur
-        return self._pulse_curve01(t, kind)
+        scale = self._pulse_curve01(t, kind)
+        if self._frame_now is not None:
+            self._pulse_cache[kind] = scale
+        return scale
 
     def is_pulse_active(self, kind: str) -> bool:
-        start, until = self._pulses.get(kind, (0.0, 0.0))
-        return start > 0.0 and self.now() < until
+        bit = PULSE_BITS.get(kind, 0)
+        if not (self._active_mask & bit):
+            return False
+        if self._query_now() < self._pulses[kind][1]:
+            return True
+        self._active_mask &= ~bit
+        return False
 
     def stop_pulse(self, kind: str):
         if kind in self._pulses:
             self._pulses[kind] = (0.0, 0.0)
+            self._active_mask &= ~PULSE_BITS[kind]
+            self._pulse_cache.pop(kind, None)
 
     # ---------- shake offset ----------
     def shake_offset(self, screen_w: int) -> tuple[float, float]:
-        import math
-        now = self.now()
+        if not self.shake_until:
+            return (0.0, 0.0)  # idle: no clock read
+        now = self._query_now()
         if now >= self.shake_until:
+            self.shake_until = 0.0  # expired: later calls take the idle path
             return (0.0, 0.0)
         sh_t = max(0.0, min(1.0, (now - self.shake_start) / SHAKE_DURATION))
         env = 1.0 - sh_t
         amp = screen_w * SHAKE_AMPLITUDE_FACT * env
-        phase = 2.0 * math.pi * SHAKE_FREQ_HZ * (now - self.shake_start)
+        phase = _TAU * SHAKE_FREQ_HZ * (now - self.shake_start)
         dx = amp * math.sin(phase)
         dy = 0.5 * amp * math.cos(phase * 0.9)
         return (dx, dy)
@@ -266,7 +353,7 @@ class EffectsManager:
     def apply_postprocess(self, frame: pygame.Surface, w: int, h: int) -> pygame.Surface:
         if not self.screen_glitch:
             return frame
-        now = self.now()
+        now = self._query_now()
         if now >= self.glitch_active_until:
             return frame
 
@@ -282,34 +369,50 @@ class EffectsManager:
         pf = GLITCH_PIXEL_FACTOR_MAX * strength
         if pf > 0:
             sw, sh = max(1, int(w * (1 - pf))), max(1, int(h * (1 - pf)))
-            small = pygame.transform.smoothscale(frame, (sw, sh))
-            out = pygame.transform.scale(small, (w, h))
-
-        # 2) RGB split
+            if self._pixel_buf is None or self._pixel_buf.get_size() != (w, h):
+                self._small_buf = pygame.Surface((w, h), frame.get_flags(), frame)
+                self._pixel_buf = pygame.Surface((w, h), frame.get_flags(), frame)
+            small = self._small_buf.subsurface((0, 0, sw, sh))
+            # weak glitches are too short and too mild for filtering to show; nearest is ~2x cheaper
+            if strength < GLITCH_SMOOTH_MIN_STRENGTH:
+                pygame.transform.scale(frame, (sw, sh), small)
+            else:
+                pygame.transform.smoothscale(frame, (sw, sh), small)
+            out = pygame.transform.scale(small, (w, h), self._pixel_buf)
+
+        # 2) RGB split. Copies go into preallocated buffers: fill with the mask, then MULT-blit the
+        # source, which equals copy() + masked fill bit for bit (white mask = plain copy).
         ch_off = int(6 * strength) + _rand.randint(0, 2)
         if ch_off:
-            base = out.copy()
+            if self._chan_buf is None or self._chan_buf.get_size() != (w, h):
+                self._split_base = pygame.Surface((w, h), out.get_flags(), out)
+                self._chan_buf = pygame.Surface((w, h), out.get_flags(), out)
+            base, chan = self._split_base, self._chan_buf
+            base.fill((255, 255, 255, 255))
+            base.blit(out, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
             for (mask, dx, dy) in (
                 ((255, 0, 0, 255), ch_off, 0),
                 ((0, 255, 0, 255), -ch_off, 0),
                 ((0, 0, 255, 255), 0, ch_off),
             ):
-                chan = base.copy()
-                tint = pygame.Surface((w, h), pygame.SRCALPHA)
-                tint.fill(mask)
-                chan.blit(tint, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+                chan.fill(mask)
+                chan.blit(base, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
                 out.blit(chan, (dx, dy), special_flags=pygame.BLEND_ADD)
 
-        # 3) Displaced horizontal bands
+        # 3) Displaced horizontal bands (self-blit: pygame handles the overlap, no band copies)
         if _rand.random() < 0.9:
             bands = _rand.randint(2, 4)
             band_h = max(4, h // (bands * 8))
+            max_dx = int(w * 0.03 * strength)
+            randint = _rand.randint
+            shifts = []
             for _ in range(bands):
-                y = _rand.randint(0, h - band_h)
-                dx = _rand.randint(-int(w * 0.03 * strength), int(w * 0.03 * strength))
-                slice_rect = pygame.Rect(0, y, w, band_h)
-                slice_surf = out.subsurface(slice_rect).copy()
-                out.blit(slice_surf, (dx, y))
+                y = randint(0, h - band_h)
+                dx = randint(-max_dx, max_dx)
+                if dx:
+                    shifts.append((out, (dx, y), (0, y, w, band_h)))
+            if shifts:
+                out.blits(shifts, doreturn=False)  # applied in order, same as separate blits
 
         # 4) Colored blocks (random artefacts)
         if _rand.random() < 0.4 * strength:
@@ -335,12 +438,12 @@ class EffectsManager:
         self.exit_active = True
 
     def is_exit_active(self) -> bool:
-        return self.exit_active and (self.now() - self.exit_start) <= self.exit_duration
+        return self.exit_active and (self._query_now() - self.exit_start) <= self.exit_duration
 
     def exit_progress(self) -> float:
         if not self.exit_active:
             return 0.0
-        t = (self.now() - self.exit_start) / max(1e-6, self.exit_duration)
+        t = (self._query_now() - self.exit_start) / max(1e-6, self.exit_duration)
         return max(0.0, min(1.0, t))
 
     def clear_exit(self):
@@ -1,24 +1,28 @@
 ﻿from __future__ import annotations
 
+import itertools
 import math
 import os
 import random
 import sys
 import time
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
 import pygame
 
-from .config import CFG, persist_windowed_size, save_config
+from .config import CFG, persist_windowed_size, queue_config
 from .constants import *
 from .enums import GlitchMode
-from .fx import EffectsManager
-from .image_store import IMAGES
+from .frame_pacer import FramePacer
+from .fx import EffectsManager, ease_out_cubic
+from .image_store import IMAGES, GlyphAtlas
 from .input_queue import InputQueue
 from .level_config import apply_levels_from_cfg, ensure_level_exists
 from .managers import BannerManager, RuleManager
 from .mods import (
     MODS,
+    BaseMod,
     allowed_mod_ids_from_settings,
     modifier_options,
     mods_from_ids,
@@ -29,7 +33,7 @@ from .modes import ModeProfile, ModeRegistry
 from .music import MusicController
 from .settings import clamp_settings, commit_settings, make_runtime_settings
 from .settings_defaults import settings_defaults_from_cfg
-from .symbols import SYMBOLS, SYMS
+from .symbols import SYM_MINUS, SYMBOLS, SYMS
 from .tutorials import (
     TutorialPlayer,
     build_tutorial_for_speed,
@@ -39,6 +43,47 @@ from .tutorials import (
 from .ui_components import InputRing, PausableCountdown, TimeBar
 
 
+@dataclass
+class _HitPolicy:
+    """Outcome of a correct answer, resolved once per target."""
+    timed: bool           # TIMED branch (time gain + mod rolls) instead of SPEEDUP time step
+    levels_up: bool       # this hit reaches the SPEEDUP level goal
+    mods: List[BaseMod]   # modifiers whose on_correct hook runs
+
+
+# control_flip_lr_ud: each direction maps to the opposite ring position
+_FLIP_POS = {"LEFT": "RIGHT", "RIGHT": "LEFT", "TOP": "BOTTOM", "BOTTOM": "TOP"}
+
+
+def _lerp_rgb(a: Tuple[int,int,int], b: Tuple[int,int,int], t: float) -> Tuple[int,int,int]:
+    return (int(a[0] + (b[0] - a[0]) * t),
+            int(a[1] + (b[1] - a[1]) * t),
+            int(a[2] + (b[2] - a[2]) * t))
+
+
+# settings_adjust: per-key step for plain numeric settings (others are handled by dedicated branches)
+_SETTINGS_STEP = {
+    "target_time_initial": 0.1,
+    "target_time_step": 0.01,
+    "target_time_min": 0.05,
+    "lives": 1,
+    "music_volume": 0.05,
+    "sfx_volume": 0.05,
+    "timed_rule_bonus": 0.5,
+    "timed_duration": 1.0,
+    "timed_gain": 0.1,
+    "timed_penalty": 0.1,
+    "memory_hide_sec": 0.1,
+    "timed_memory_hide_sec": 0.1,
+}
+_TIMED_DIFFICULTIES = ("EASY", "MEDIUM", "HARD")
+_GLITCH_MODES = ("NONE", "TEXT", "SCREEN", "BOTH")
+_FPS_CAPS = (30, 45, 60, 90, 120)
+_RING_PALETTES = ("auto", "clean-white", "electric-blue", "neon-cyan", "violet-neon", "magenta")
+
+
+# 1 / ln(1 - p): scales -ln(U) into a geometric gap between glitched characters
+_GLITCH_GAP_SCALE = 1.0 / math.log(1.0 - TEXT_GLITCH_CHAR_PROB) if 0.0 < TEXT_GLITCH_CHAR_PROB < 1.0 else None
 
 
 class Game:
@@ -49,12 +94,13 @@ class Game:
         self.screen = screen
         self.cfg = CFG
         self.images = IMAGES
+        self.glyphs = GlyphAtlas()  # per-character renders for score/timer digits
         self.mode: Mode = mode
         self.scene: Scene = Scene.MENU
         self.tutorial: Optional[TutorialPlayer] = None
 
         self.w, self.h = self.screen.get_size()
-        self.clock = pygame.time.Clock()
+        self.pacer = FramePacer()
         self.timer_timed = PausableCountdown(self.now)  
         self.timer_speed = PausableCountdown(self.now)   
 
@@ -63,28 +109,50 @@ class Game:
         self.last_window_size = self.screen.get_size()
 
         # --- Input debouncing ---
-        self.keys_down: set[int] = set()
+        self._keys_mask = 0  # held ring keys, one bit each (see _key_bit)
         self.lock_until_all_released = False
         self.accept_after = 0.0
 
-        # --- Font cache ---
-        self.hud_label_font = pygame.font.Font(FONT_PATH, HUD_LABEL_FONT_SIZE)
-        self.hud_value_font = pygame.font.Font(FONT_PATH, HUD_VALUE_FONT_SIZE)
-        self._font_cache: dict[tuple[str,int,bool,bool], pygame.font.Font] = {}
+        # --- Font cache (HUD fonts themselves are assigned by _rebuild_fonts) ---
+        self._font_cache: dict[tuple[str,int,bool,bool], pygame.font.Font] = {}  # kept across rebuilds
+        self._fonts_scale: Optional[float] = None  # ui_scale the HUD fonts were last built for
+        self._legend_cache: dict[float, pygame.Surface] = {}  # levels-table legend per scale
+        self._scratch_pool: dict[tuple[int, int], pygame.Surface] = {}  # reusable SRCALPHA surfaces by pow2 size
+        self._panel_cache: dict[tuple, tuple[pygame.Surface, pygame.Surface]] = {}  # rule panel (panel, composite), LRU order
+        self._text_cache: dict[tuple, pygame.Surface] = {}  # draw_text output for static text, LRU order
+        self._render_cache: dict[tuple, pygame.Surface] = {}  # raw font.render() of unglitched text, LRU order
+        self._shadow_cache: dict[int, tuple[pygame.Surface, pygame.Surface]] = {}  # id(text) -> (text, shadow), LRU order
+        self._glyph_cache: dict[tuple, tuple[pygame.Surface, tuple[int, int]]] = {}  # symbol/arrow (surf, offset), LRU order
+        self._hud_chrome: Optional[pygame.Surface] = None  # static topbar + capsule, see _build_hud_chrome
+        self._hud_chrome_key: Optional[tuple] = None
+        self._hud_top: Optional[tuple[pygame.Surface, tuple[int, int]]] = None  # composed topbar snapshot, see _draw_hud
+        self._hud_top_key: Optional[tuple] = None
+        self._scene_bg_cache: dict[tuple, pygame.Surface] = {}  # background + static scene chrome, see _blit_instruction_bg
+        self._hud_blit_list: list[tuple[pygame.Surface, tuple[int, int]]] = []  # HUD text blits, flushed once per frame
+        self._ring_colors_cache: Optional[tuple] = None  # (key, colors) for ring_colors()
+        self._viewport_cache: Optional[tuple] = None  # (key, rect) for _settings_viewport(); read-only rect
+        self._layout_perms: list[tuple[str, ...]] = list(itertools.permutations(SYMS))  # candidate ring layouts
+        self._layout_perm_idx = {perm: i for i, perm in enumerate(self._layout_perms)}  # layout -> index above
+        self._dirty_rects: list[pygame.Rect] = []  # areas touched by the current gameplay frame
+        self._dirty_prev: Optional[list[pygame.Rect]] = None  # previous frame's areas; None forces a full flip
+        self._dirty_scene: Optional[Scene] = None  # scene _dirty_prev was recorded in
         self._sysfont_fallback = "arial"
 
         # --- Background assets ---
+        self._bg_cache: dict[tuple[int, int, int], pygame.Surface] = {}  # cover-scaled bg by (id(raw), w, h), LRU order
         self.bg_img_raw = self._load_background()
         self.bg_img: Optional[pygame.Surface] = None
 
         # --- Layout & framebuffer ---
+        self.ui_scale = 1.0
+        self._rule_pinned_y = 0  # real value set by _recompute_layout
+        self._layout_size: Optional[tuple[int, int]] = None  # screen size the current layout was built for
         self._recompute_layout()
         self.fb = pygame.Surface((self.w, self.h), pygame.SRCALPHA)
 
         # Fonts used when the rule banner is centred vs pinned to the HUD
         self.rule_font_center: Optional[pygame.font.Font] = None
         self.rule_font_pinned: Optional[pygame.font.Font] = None
-        self.ui_scale = 1.0
         self._rebuild_fonts() 
 
         # --- Gameplay state ---
@@ -102,6 +170,7 @@ class Game:
 
         self.target: Optional[str] = None
         self.target_time = TARGET_TIME_INITIAL
+        self._target_halftime: Optional[float] = None  # remaining seconds that trigger the half-time pulse
 
         self.pause_until = 0.0
         self.symbol_spawn_time = 0.0
@@ -109,6 +178,7 @@ class Game:
 
         # --- Level configuration / ring layout ---
         self.level_cfg: LevelCfg = LEVELS[1]
+        self._mapping_banner_spec: Optional[RuleSpec] = None  # level_cfg's start-of-level MAPPING rule, set by apply_level
 
         # --- Render helpers ---
         self.ring = InputRing(self)
@@ -153,7 +223,24 @@ class Game:
             pygame.K_UP: "TOP", pygame.K_RIGHT: "RIGHT", pygame.K_LEFT: "LEFT", pygame.K_DOWN: "BOTTOM",
             pygame.K_w: "TOP",  pygame.K_d: "RIGHT",     pygame.K_a: "LEFT",   pygame.K_s: "BOTTOM",
         }
-        self.keymap_current: Dict[int, str] = {}
+        self._key_to_pos_items = tuple(self.key_to_pos.items())
+        self._key_bit = {k: 1 << i for i, k in enumerate(self.key_to_pos)}
+        self._scene_key_handlers = {
+            Scene.MENU: self._on_key_menu,
+            Scene.OVER: self._on_key_over,
+            Scene.SETTINGS: self._on_key_settings,
+            Scene.INSTRUCTION: self._on_key_instruction,
+        }
+        self._settings_keymap = {  # key -> (handler, arg) for _on_key_settings
+            pygame.K_RETURN: (self._settings_key_confirm, 0),
+            pygame.K_LEFT: (self._settings_key_horizontal, -1),
+            pygame.K_RIGHT: (self._settings_key_horizontal, +1),
+            pygame.K_UP: (self._settings_key_vertical, -1),
+            pygame.K_DOWN: (self._settings_key_vertical, +1),
+        }
+        self.keymap_current: Dict[int, str] = {}  # updated in place by _recompute_keymap
+        self._ring_layout_inv: Dict[str, str] = {}  # symbol -> ring position
+        self._on_correct_next: Optional[_HitPolicy] = None
         self._recompute_keymap()
 
         self.rotation_breaks: set[int] = set()
@@ -173,6 +260,8 @@ class Game:
         self._settings_row_tops: List[Tuple[float, float]] = []  # (y, height) before scroll offset
         self.settings_idx = 0
         self.settings = make_runtime_settings(CFG)
+        self._settings_rev = 0  # bumped whenever self.settings may change (settings_adjust / open_settings)
+        self._settings_items_cache: Optional[tuple[tuple, list]] = None  # (state key, settings_items() result)
 
         for k, v in settings_defaults_from_cfg():
             self.settings.setdefault(k, v)
@@ -197,6 +286,10 @@ class Game:
         self.exit_dir_pos: Optional[str] = None  # "TOP"|"RIGHT"|"LEFT"|"BOTTOM"
         self.instruction_intro_t = 0.0
         self.instruction_intro_dur = 0.0
+        self._menu_anim = {
+            "active": False, "from_idx": 0, "to_idx": 0,
+            "t0": 0.0, "dur": 0.35, "dir": +1
+        }
 
         # Music
         self.music_ok = False
@@ -228,7 +321,7 @@ class Game:
         if self.is_new_best:
             self.highscore = self.final_total
             CFG["highscore"] = int(self.highscore)
-            save_config({"highscore": CFG["highscore"]})
+            queue_config({"highscore": CFG["highscore"]})
 
         try:
             self._ensure_mode_system_ready()
@@ -242,7 +335,8 @@ class Game:
     # ---- Timing utilities ----
 
     def now(self) -> float:
-        return time.time()
+        # monotonic: only ever compared with other now() values, never with wall-clock time
+        return time.perf_counter()
   
     def stop_timer(self):
         self.timer_timed.stop()
@@ -256,20 +350,20 @@ class Game:
                 self.timer_speed.resume()
 
     def px(self, v: float) -> int:
-        return max(1, int(round(v * getattr(self, "ui_scale", 1.0))))
+        return max(1, int(round(v * self.ui_scale)))
 
     def _lock_inputs(self, delay: float = INPUT_ACCEPT_DELAY) -> None:
         self.lock_until_all_released = True
         self.accept_after = self.now() + max(0.0, delay)
 
     def _try_start_exit_slide(self, required_symbol: str) -> bool:
-        if self.banner.is_active(self.now()):
+        now = self.now()
+        if self.banner.is_active(now):
             return False
-        pos = next((p for p, s in self.ring_layout.items() if s == required_symbol), None)
+        pos = self._ring_layout_inv.get(required_symbol)  # kept in sync by _recompute_keymap
         if not pos or not self.target:
             return False
 
-        now = self.now()
         self.exit_dir_pos = pos
         self.fx.start_exit_slide(self.target, duration=EXIT_SLIDE_SEC)
         self.pause_until = max(self.pause_until, now + EXIT_SLIDE_SEC)
@@ -279,14 +373,24 @@ class Game:
         return True
 
     def _glitch_text(self, text: str) -> str:
-        out_chars = []
-        for ch in text:
+        # Each non-space character flips with TEXT_GLITCH_CHAR_PROB. Instead of one random() per
+        # character, draw the gap to the next flip (geometric); short labels usually exit at once.
+        if _GLITCH_GAP_SCALE is None:
+            if TEXT_GLITCH_CHAR_PROB <= 0.0:
+                return text
+            return "".join(ch if ch.isspace() else random.choice(TEXT_GLITCH_CHARSET) for ch in text)
+        gap = int(math.log(1.0 - random.random()) * _GLITCH_GAP_SCALE)
+        if gap >= len(text):
+            return text
+        out_chars = list(text)
+        for i, ch in enumerate(out_chars):
             if ch.isspace():
-                out_chars.append(ch)
-            elif random.random() < TEXT_GLITCH_CHAR_PROB:
-                out_chars.append(random.choice(TEXT_GLITCH_CHARSET))
-            else:
-                out_chars.append(ch)
+                continue
+            if gap:
+                gap -= 1
+                continue
+            out_chars[i] = random.choice(TEXT_GLITCH_CHARSET)
+            gap = int(math.log(1.0 - random.random()) * _GLITCH_GAP_SCALE)
         return "".join(out_chars)
 
     def lives_enabled(self) -> bool:
@@ -344,6 +448,7 @@ class Game:
         if old != self.timed_active_mods:
             self._last_timed_mods = list(self.timed_active_mods)
             self._timed_mods_changed_at = self.now()
+        self._on_correct_next = None
 
     def _timed_roll_mod(self) -> None:
         if self._mods_chain_active() or (self._pending_timed_mods is not None):
@@ -430,8 +535,7 @@ class Game:
     def _ease_in_out(self, t: float) -> float:
         return self.fx._ease_in_out(t)
 
-    def _ease_out_cubic(self, t: float) -> float:
-        return self.fx._ease_out_cubic(t)
+    _ease_out_cubic = staticmethod(ease_out_cubic)
 
     def _ease_in_cubic(self, t: float) -> float:
         return self.fx._ease_in_cubic(t)
@@ -467,7 +571,22 @@ class Game:
 
     def _rebuild_fonts(self) -> None:
         self.ui_scale = self._compute_ui_scale()
-        self._font_cache.clear()
+        if self.ui_scale == self._fonts_scale:
+            # same font sizes (ui_scale is clamped, so many window sizes share it): fonts and the
+            # id(font)-keyed caches stay valid; rule panels are sized from self.w, so drop those
+            self._panel_cache.clear()
+            return
+        self._fonts_scale = self.ui_scale
+        # loaded fonts stay valid across scale changes (keyed by size); only drop them when many
+        # sizes piled up, here where every id(font)-keyed cache below is cleared as well
+        if len(self._font_cache) > FONT_CACHE_MAX:
+            self._font_cache.clear()
+        self._legend_cache.clear()
+        self._panel_cache.clear()
+        self._text_cache.clear()
+        self._render_cache.clear()
+        self._shadow_cache.clear()
+        self.glyphs.clear()
 
         def S(px: int) -> int:
             return max(8, int(round(px * self.ui_scale)))
@@ -492,24 +611,47 @@ class Game:
         path = CFG.get("images", {}).get("background") if isinstance(CFG.get("images"), dict) else None
         if not path or not os.path.exists(path):
             return None
-        return IMAGES.load(path, allow_alpha=True)
+        return IMAGES.load(path, allow_alpha=False)  # opaque: display-format blits, no per-pixel blend
 
     def _rescale_background(self) -> None:
-        raw = getattr(self, "bg_img_raw", None)
+        raw = self.bg_img_raw
         if not raw:
             self.bg_img = None
             return
-        rw, rh = raw.get_size()
         sw, sh = self.w, self.h
-        scale = max(sw / rw, sh / rh)  # cover
-        new_size = (int(rw * scale), int(rh * scale))
-        img = pygame.transform.smoothscale(raw, new_size)
-        x = (img.get_width() - sw) // 2
-        y = (img.get_height() - sh) // 2
-        self.bg_img = img.subsurface(pygame.Rect(x, y, sw, sh)).copy()
-
-    def _recompute_layout(self) -> None:
-        self.w, self.h = self.screen.get_size()
+        key = (id(raw), sw, sh)
+        cached = self._bg_cache.pop(key, None)
+        if cached is None:
+            rw, rh = raw.get_size()
+            # cover, in integers: the limiting side lands exactly on the screen edge
+            if sw * rh >= sh * rw:
+                new_size = (sw, sw * rh // rw)
+            else:
+                new_size = (sh * rw // rh, sh)
+            if new_size == (rw, rh):
+                img = raw  # already cover-sized (e.g. fullscreen at the image's native resolution)
+            else:
+                if rw > 2 * new_size[0] and rh > 2 * new_size[1]:
+                    # cheap nearest pass to 2x target first; smoothscale then filters a quarter of the pixels
+                    raw = pygame.transform.scale(raw, (new_size[0] * 2, new_size[1] * 2))
+                img = pygame.transform.smoothscale(raw, new_size)
+            x = (img.get_width() - sw) // 2
+            y = (img.get_height() - sh) // 2
+            if img.get_size() == (sw, sh):
+                cached = img  # nothing to crop; the raw/scaled surface is never drawn into
+            else:
+                cached = pygame.Surface((sw, sh), 0, img)  # raw is display-format and opaque, so img is too
+                cached.blit(img, (-x, -y))
+            if len(self._bg_cache) >= BG_CACHE_MAX:
+                self._bg_cache.pop(next(iter(self._bg_cache)))
+        self._bg_cache[key] = cached  # most-recent end
+        self.bg_img = cached
+
+    def _recompute_layout(self, *, force: bool = False) -> None:
+        size = self.screen.get_size()
+        if not force and size == self._layout_size:
+            return  # same-size mode switch / resize echo: everything below is already valid
+        self.w, self.h = size
 
         # --- Pads layout (kept for potential future use) ---
         pad_w = (self.w * (1 - 2 * PADDING - GAP)) / 2
@@ -543,8 +685,86 @@ class Game:
 
         self._rescale_background()
         self.fb = pygame.Surface((self.w, self.h), pygame.SRCALPHA)
+        self._black_overlay = pygame.Surface((self.w, self.h))  # fade overlay; alpha set per frame
+        self._black_overlay.fill((0, 0, 0))
+        self._hud_chrome = None
+        self._hud_top = None
+        self._scene_bg_cache.clear()
+        self._dirty_prev = None
         self._rebuild_fonts() 
 
+        # resting Y of the pinned rule banner (below the score capsule); px() needs ui_scale from _rebuild_fonts
+        margin = self.px(RULE_BANNER_PINNED_MARGIN)
+        self._rule_pinned_y = max(self.topbar_rect.bottom + self.px(8), self.score_capsule_rect.bottom + margin)
+
+        # --- Per-layout draw geometry (symbol centre, exit slide, HUD capsule) ---
+        self._symbol_size_f = self.w * SYMBOL_BASE_SIZE_FACTOR
+        self._center_xf = self.w * 0.5
+        self._center_yf = self.h * CENTER_Y_FACTOR
+        self._spawn_offset_y = self.h * SYMBOL_ANIM_OFFSET_Y
+        self._slide_dist = int(self.w * 0.35)  # distance to slide past the screen edge
+        base_size = int(self._symbol_size_f)
+        cx, cy = int(self._center_xf), int(self._center_yf)
+        r = int(base_size * RING_RADIUS_FACTOR)
+        self._ring_key = ((cx, cy), base_size)  # (center, base_size) the table below was built for
+        self._ring_pos = {pos: (cx + dx * r, cy + dy * r) for pos, (dx, dy) in RING_DIR_VEC.items()}
+        self._layout_hud()
+        self._preheat_glyphs()
+        self._layout_size = size
+
+    def _preheat_glyphs(self) -> None:
+        """Scale the ring image and rasterize symbol glyphs at the resting sizes of this layout."""
+        base_size = int(self._symbol_size_f)
+        r = int(base_size * RING_RADIUS_FACTOR)
+        ring_path = self.cfg.get("images", {}).get("ring")
+        fit = self.images.fit_size(ring_path, r * 2, r * 2) if ring_path else None
+        if fit:
+            self.images.load_scaled(ring_path, fit)
+        icon_size = int(base_size * RING_ICON_SIZE_FACTOR)
+        for name in SYMS:
+            self._symbol_glyph(name, base_size, base_size)
+            self._symbol_glyph(name, icon_size, icon_size)
+
+    def _layout_hud(self) -> None:
+        """Resolve the HUD blocks inside the topbar and score capsule; needs fonts + ui_scale."""
+        cap = self.score_capsule_rect
+        pad_x = int(self.w * TOPBAR_PAD_X_FACTOR)
+        self._hud_left_block = pygame.Rect(
+            pad_x, self.topbar_rect.top,
+            max(1, cap.left - pad_x * 2),
+            self.topbar_rect.height,
+        )
+        self._hud_right_block = pygame.Rect(
+            cap.right + pad_x, self.topbar_rect.top,
+            max(1, self.w - pad_x - (cap.right + pad_x)),
+            self.topbar_rect.height,
+        )
+
+        pad_in_x = self.px(12)
+        pad_in_y = self.px(10)
+        inner = cap.inflate(-pad_in_x * 2, -pad_in_y * 2)
+
+        head_h = int(inner.height * CAPSULE_HEAD_RATIO)
+        head_rect = pygame.Rect(inner.left, inner.top, inner.width, max(1, head_h))
+
+        gap = 2
+        label_h_fix = self.score_label_font.get_height()
+        value_h_fix = self.score_value_font.get_height()
+        block_h_fix = label_h_fix + gap + value_h_fix
+
+        # vertically centre the [label + value] block within head_rect
+        block_top = head_rect.top + max(0, (head_rect.height - block_h_fix) // 2)
+        self._hud_score_label_pos = (head_rect.centerx, block_top)
+        self._hud_value_rect = pygame.Rect(head_rect.left, block_top + label_h_fix + gap, head_rect.width, value_h_fix)
+
+        sep_w = int(inner.width * CAPSULE_DIVIDER_WIDTH_RATIO)
+        sep_x1 = inner.centerx - sep_w // 2
+        sep_y  = head_rect.bottom + self.px(6)
+        self._hud_sep = ((sep_x1, sep_y), (sep_x1 + sep_w, sep_y))
+
+        content_top = sep_y + CAPSULE_DIVIDER_THICKNESS + self.px(6)
+        self._hud_footer = pygame.Rect(inner.left, content_top, inner.width, max(0, inner.bottom - content_top))
+
     def _ensure_music(self) -> None:
         if self.music_ok:
             return
@@ -643,10 +863,6 @@ class Game:
         if cur.menu_music_path:
             self.music.fade_to(cur.menu_music_path, ms=cur.crossfade_ms)
 
-        self._menu_anim = {
-            "active": False, "from_idx": 0, "to_idx": 0,
-            "t0": 0.0, "dur": 0.35, "dir": +1
-        }
         self._glitch_before_slide: Optional[str] = None  
 
     def _menu_get_bg(self, profile: ModeProfile) -> pygame.Surface:
@@ -676,7 +892,7 @@ class Game:
         w, h = self.w, self.h
         out = pygame.Surface((w, h))
 
-        anim = getattr(self, "_menu_anim", {"active": False})
+        anim = self._menu_anim
         peek_ratio = 0.0 
         cur = self.mode_registry.current()
         cur_bg = self._menu_get_bg(cur)
@@ -711,7 +927,7 @@ class Game:
         self.bg_img = out
 
     def _start_menu_mode_transition(self, to_idx: int) -> None:
-        if getattr(self, "_menu_anim", {}).get("active", False):
+        if self._menu_anim["active"]:
             return
         if not (0 <= to_idx < len(self.mode_registry.modes)):
             return
@@ -736,8 +952,8 @@ class Game:
         self.fx.set_glitch_mode(GlitchMode.NONE)
 
     def _update_menu_mode_transition(self) -> None:
-        anim = getattr(self, "_menu_anim", None)
-        if not anim or not anim["active"]:
+        anim = self._menu_anim
+        if not anim["active"]:
             return
         t = (self.now() - anim["t0"]) / max(1e-6, anim["dur"])
         if t >= 1.0:
@@ -776,14 +992,14 @@ class Game:
             self.last_window_size = self.screen.get_size()
             self._recompute_layout()
         else:
-            w, h = getattr(self, "last_windowed_size", WINDOWED_DEFAULT_SIZE)
+            w, h = self.last_windowed_size
             self._set_windowed_size(w, h)
         pygame.display.set_caption("Remap")
 
     def _snap_to_aspect(self, width: int, height: int) -> Tuple[int, int]:
         target_w, target_h = ASPECT_RATIO
         ratio = target_w / target_h
-        last_w, last_h = getattr(self, "last_window_size", (width, height))
+        last_w, last_h = self.last_window_size
         if ASPECT_SNAP_TOLERANCE > 0:
             r = width / max(1, height)
             if abs(r - ratio) <= ASPECT_SNAP_TOLERANCE * ratio:
@@ -805,20 +1021,38 @@ class Game:
 
 
     def _recompute_keymap(self) -> None:
-        self.keymap_current = {
-            k: self.ring_layout[self._control_pos(pos)]
-            for k, pos in self.key_to_pos.items()
-        }
+        # runs on every ring swap / rotation; refill the same dicts instead of building new ones
+        layout = self.ring_layout
+        keymap = self.keymap_current
+        if self.level_cfg.control_flip_lr_ud:
+            for k, pos in self._key_to_pos_items:
+                keymap[k] = layout[_FLIP_POS.get(pos, pos)]
+        else:
+            for k, pos in self._key_to_pos_items:
+                keymap[k] = layout[pos]
+        inv = self._ring_layout_inv
+        inv.clear()
+        for pos, sym in layout.items():
+            inv[sym] = pos
 
     def _control_pos(self, pos: str) -> str:
-        if getattr(self.level_cfg, "control_flip_lr_ud", False):
-            flip = {"LEFT":"RIGHT", "RIGHT":"LEFT", "TOP":"BOTTOM", "BOTTOM":"TOP"}
-            return flip.get(pos, pos)
+        if self.level_cfg.control_flip_lr_ud:
+            return _FLIP_POS.get(pos, pos)
         return pos
 
 # ---- Settings ----
 
     def settings_items(self):
+        # queried every settings frame and on every key press; rebuild only when the inputs move
+        key = (self._settings_rev, self.settings_page, self.highscore, self.levels_active)
+        cached = self._settings_items_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        items = self._build_settings_items()
+        self._settings_items_cache = (key, items)
+        return items
+
+    def _build_settings_items(self) -> list[tuple[str, str, Optional[str]]]:
         items: list[tuple[str, str, Optional[str]]] = []
 
         # 0=BASIC, 1=TIMED, 2=SPEED-UP
@@ -884,13 +1118,19 @@ class Game:
         self._ensure_selected_visible()
 
     def _settings_viewport(self) -> pygame.Rect:
+        key = (id(self.font), self.w, self.h)  # px() follows ui_scale, which follows w/h
+        cached = self._viewport_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
         top = int(self.h * SETTINGS_LIST_Y_START_FACTOR)
         # reserve vertical space for the help footer
         help_margin = self.px(SETTINGS_HELP_MARGIN_TOP)
         help_gap    = self.px(SETTINGS_HELP_GAP)
         help_h = self.font.get_height()*2 + help_margin + help_gap + self.px(8)
         height = max(50, self.h - top - help_h)
-        return pygame.Rect(0, top, self.w, height)
+        vp = pygame.Rect(0, top, self.w, height)
+        self._viewport_cache = (key, vp)
+        return vp
 
     def _ensure_selected_visible(self) -> None:
         if not self._settings_row_tops:
@@ -918,9 +1158,10 @@ class Game:
         key = items[self.settings_idx][2]
         if key is None:
             return
+        self._settings_rev += 1  # everything below may edit self.settings
 
         if key == "timed_difficulty":
-            opts = ["EASY", "MEDIUM", "HARD"]
+            opts = _TIMED_DIFFICULTIES
             cur = self.settings.get("timed_difficulty", "EASY")
             i = (opts.index(cur) + delta) % len(opts)
             self.settings["timed_difficulty"] = opts[i]
@@ -964,7 +1205,7 @@ class Game:
             return
 
         if key == "glitch_mode":
-            opts = ["NONE", "TEXT", "SCREEN", "BOTH"]
+            opts = _GLITCH_MODES
             cur = self.settings.get("glitch_mode", "BOTH")
             i = (opts.index(cur) + delta) % len(opts)
             val = opts[i]
@@ -979,7 +1220,7 @@ class Game:
             return
 
         if key == "fps":
-            caps = [30, 45, 60, 90, 120]
+            caps = _FPS_CAPS
             cur  = int(self.settings.get("fps", FPS))
             try: i = caps.index(cur)
             except ValueError: i = 2
@@ -988,7 +1229,7 @@ class Game:
             return
 
         if key == "ring_palette":
-            opts = ["auto", "clean-white", "electric-blue", "neon-cyan", "violet-neon", "magenta"]
+            opts = _RING_PALETTES
             cur = self.settings.get("ring_palette", "auto")
             i = (opts.index(cur) + delta) % len(opts)
             self.settings["ring_palette"] = opts[i]
@@ -998,8 +1239,7 @@ class Game:
             v = int(self.settings.get("remap_every_hits", RULE_EVERY_HITS)) + delta
             v = max(1, min(10, v))
             self.settings["remap_every_hits"] = v
-            if hasattr(self, "rules"):
-                self.rules.mapping_every_hits = int(v)
+            self.rules.mapping_every_hits = int(v)
             return
 
         if key == "spin_every_hits":
@@ -1023,7 +1263,7 @@ class Game:
             self.settings["fullscreen"] = not self.settings["fullscreen"]
             self._set_display_mode(bool(self.settings["fullscreen"]))
             CFG["display"]["fullscreen"] = bool(self.settings["fullscreen"])
-            save_config({"display": {"fullscreen": CFG["display"]["fullscreen"]}})
+            queue_config({"display": {"fullscreen": CFG["display"]["fullscreen"]}})
             return
 
         if key == "levels_active":
@@ -1037,20 +1277,7 @@ class Game:
                 self.level_table_sel_col = min(self.level_table_sel_col, 4)
             return
 
-        step = {
-            "target_time_initial": 0.1,
-            "target_time_step": 0.01,
-            "target_time_min": 0.05,
-            "lives": 1,
-            "music_volume": 0.05,
-            "sfx_volume": 0.05,
-            "timed_rule_bonus": 0.5,
-            "timed_duration": 1.0,
-            "timed_gain": 0.1,
-            "timed_penalty": 0.1,
-            "memory_hide_sec": 0.1,
-            "timed_memory_hide_sec": 0.1,
-        }.get(key, 0.0)
+        step = _SETTINGS_STEP.get(key, 0.0)
 
         if step == 0.0:
             return
@@ -1072,7 +1299,7 @@ class Game:
             pygame.mixer.music.set_volume(float(self.settings["music_volume"]))
         elif key == "sfx_volume":
             v = float(self.settings["sfx_volume"])
-            for s in getattr(self, "sfx", {}).values():
+            for s in self.sfx.values():
                 s.set_volume(v)
             try:
                 if self.sfx.get("point"):
@@ -1082,6 +1309,7 @@ class Game:
 
     def open_settings(self) -> None:
         self.settings = make_runtime_settings(CFG)
+        self._settings_rev += 1
 
         for k, v in settings_defaults_from_cfg():
             self.settings.setdefault(k, v)
@@ -1158,7 +1386,7 @@ class Game:
             }
         payload["levels"] = levels_out
 
-        save_config(payload)
+        queue_config(payload)
 
         def _deep_merge(dst, src):
             for k, v in src.items():
@@ -1171,7 +1399,7 @@ class Game:
 
         if self.music_ok:
             pygame.mixer.music.set_volume(float(self.settings.get("music_volume", CFG["audio"]["music_volume"])))
-        for sfx in getattr(self, "sfx", {}).values():
+        for sfx in self.sfx.values():
             sfx.set_volume(float(self.settings.get("sfx_volume", CFG["audio"]["sfx_volume"])))
 
         # fullscreen + UI
@@ -1259,6 +1487,7 @@ class Game:
         self.rules.current_mapping = None
         self.target = None
         self.target_time = float(self.settings.get("target_time_initial", TARGET_TIME_INITIAL))
+        self._target_halftime = None
         self.symbol_spawn_time = 0.0
         self.pause_until = 0.0
 
@@ -1291,9 +1520,12 @@ class Game:
     def apply_level(self, lvl: int) -> None:
         self.level_cfg = LEVELS.get(lvl, LEVELS[max(LEVELS.keys())])
         self.level_goal = int(max(1, self.level_cfg.hits_required))
+        self._on_correct_next = None
 
         self.rules.install([])
         self._apply_modifiers_to_fields(self.level_cfg)
+        self._mapping_banner_spec = next((s for s in self.level_cfg.rules
+                                          if s.type is RuleType.MAPPING and s.banner_on_level_start), None)
         self.memory_show_icons = True
 
         self.instruction_text = f"LEVEL {lvl}"
@@ -1323,14 +1555,31 @@ class Game:
 
     def new_target(self) -> None:
         prev = self.target
-        choices = [s for s in SYMS if s != prev] if prev else SYMS
+        choices = SYM_MINUS[prev] if prev else SYMS
         self.target = random.choice(choices)
         self.symbol_spawn_time = self.now()
+        self._on_correct_next = self._build_hit_policy()
         self.fx.stop_pulse('symbol')
         self.fx.stop_pulse('timer')
 
         if self.mode is Mode.SPEEDUP and self.scene is Scene.GAME:
-            self.timer_speed.start(self.target_time)
+            self._start_target_timer()
+
+    def _build_hit_policy(self) -> _HitPolicy:
+        timed = self.mode is Mode.TIMED
+        if timed:
+            mods = mods_from_ids(self.timed_active_mods)
+        else:
+            mods = mods_from_ids(getattr(self.level_cfg, "_mods_resolved", self.level_cfg.modifiers or []))
+        return _HitPolicy(
+            timed=timed,
+            levels_up=(not timed) and (self.hits_in_level + 1 >= self.level_goal),
+            mods=mods,
+        )
+
+    def _start_target_timer(self) -> None:
+        self.timer_speed.start(self.target_time)
+        self._target_halftime = 0.5 * self.target_time
 
     def _start_mapping_banner(self, from_pinned: bool = False) -> None:
         now = self.now()
@@ -1358,9 +1607,7 @@ class Game:
 
         if self.mode is Mode.SPEEDUP:
             self.rules.install(self.level_cfg.rules)
-            mapping_spec = next((s for s in (self.level_cfg.rules or [])
-                                if s.type is RuleType.MAPPING and s.banner_on_level_start), None)
-            if mapping_spec:
+            if self._mapping_banner_spec:
                 self.rules.roll_mapping(SYMS)
                 self._start_mapping_banner(from_pinned=False)
             else:
@@ -1378,7 +1625,7 @@ class Game:
         if self.mode is Mode.TIMED:
             self.timer_timed.start(float(self.settings.get("timed_duration", TIMED_DURATION)))
         elif self.mode is Mode.SPEEDUP and self.target:
-            self.timer_speed.start(self.target_time)
+            self._start_target_timer()
 
     def _cleanup_exit_slide_if_ready(self) -> None:
         if not self.exit_dir_pos:
@@ -1402,116 +1649,122 @@ class Game:
                 return i
         return 0
 
+    # ---- Per-scene KEYDOWN handlers (return True when the key is consumed) ----
+    def _on_key_menu(self, k: int) -> bool:
+        self._ensure_mode_system_ready()
+        if k == pygame.K_RETURN:
+            self.start_game()
+            return True
+        if k in (pygame.K_LEFT, pygame.K_RIGHT):
+            delta = -1 if k == pygame.K_LEFT else +1
+            to_idx = self.mode_registry.next_index(delta)
+            if to_idx is not None:
+                self._start_menu_mode_transition(to_idx)
+            return True
+        return False
+
+    def _on_key_over(self, k: int) -> bool:
+        if k == pygame.K_SPACE:
+            self.start_game()
+            return True
+        return False
+
+    def _on_key_settings(self, k: int) -> bool:
+        entry = self._settings_keymap.get(k)
+        if entry is None:
+            return False
+        fn, arg = entry
+        fn(arg)
+        return True
+
+    def _settings_key_confirm(self, _arg: int = 0) -> None:
+        if not self.settings_focus_table:
+            items = self.settings_items()
+            label, value, key = items[self.settings_idx]
+            if key == "highscore" and self.highscore != 0:
+                self.highscore = 0
+                CFG["highscore"] = 0
+                queue_config({"highscore": 0})
+                return
+        self.settings_save()
+
+    def _settings_key_horizontal(self, delta: int) -> None:
+        if self.settings_focus_table:
+            col = max(1, min(4, self.level_table_sel_col))
+            lid = self.level_table_sel_row
+            if col == 1:
+                L = LEVELS.get(lid)
+                if L:
+                    L.hits_required = max(1, min(999, L.hits_required + delta))
+                    if self.level == lid:
+                        self.level_goal = L.hits_required
+            else:
+                self._set_level_mod_slot(lid, col - 2, delta)
+        else:
+            self.settings_adjust(delta)
+
+    def _settings_key_vertical(self, delta: int) -> None:
+        if self.settings_focus_table:
+            col, row = self.level_table_sel_col + delta, self.level_table_sel_row
+            if 1 <= col <= 4:
+                self.level_table_sel_col = col
+            elif delta > 0:
+                if row < self.levels_active:
+                    self.level_table_sel_row = row + 1
+                    self.level_table_sel_col = 1
+            elif row > 1:
+                self.level_table_sel_row = row - 1
+                self.level_table_sel_col = 4
+            else:
+                self.settings_focus_table = False
+                self.settings_idx = self._last_editable_settings_idx()
+        elif delta > 0 and self.settings_idx == self._last_editable_settings_idx():
+            if self.settings_page == 1:
+                self.settings_focus_table = True
+                self.level_table_sel_row = 1
+                self.level_table_sel_col = 1
+                self._ensure_selected_visible()
+        else:
+            self.settings_move(delta)
+
+    def _on_key_instruction(self, k: int) -> bool:
+        if k in (pygame.K_RETURN, pygame.K_SPACE) or k in self.key_to_pos:
+            self._enter_gameplay_after_instruction()
+            return True
+        return False
+
     def handle_event(self, event: pygame.event.Event, iq: InputQueue):
         if event.type == pygame.VIDEORESIZE:
             self.handle_resize(event.w, event.h)
             return
 
         if event.type == pygame.KEYDOWN:
-            if event.key in (pygame.K_ESCAPE, pygame.K_q):
+            k = event.key
+            if k in (pygame.K_ESCAPE, pygame.K_q):
                 pygame.quit(); sys.exit(0)
 
-            if event.key == pygame.K_o:
+            if k == pygame.K_o:
                 self.toggle_settings()
                 return
 
-            if self.scene is Scene.MENU:
-                self._ensure_mode_system_ready()
-                if event.key == pygame.K_RETURN:
-                    self.start_game(); return
-                if event.key in (pygame.K_LEFT, pygame.K_RIGHT):
-                    delta = -1 if event.key == pygame.K_LEFT else +1
-                    to_idx = self.mode_registry.next_index(delta)
-                    if to_idx is not None:
-                        self._start_menu_mode_transition(to_idx)
-                    return
-
-            elif self.scene is Scene.OVER:
-                if event.key == pygame.K_SPACE:
-                    self.start_game(); return
-
-            elif self.scene is Scene.SETTINGS:
-                if event.key == pygame.K_RETURN:
-                    if not self.settings_focus_table:
-                        items = self.settings_items()
-                        label, value, key = items[self.settings_idx]
-                        if key == "highscore" and self.highscore != 0:
-                            self.highscore = 0
-                            CFG["highscore"] = 0
-                            save_config({"highscore": 0})
-                            return
-                    self.settings_save()
-                    return
-
-                if event.key in (pygame.K_LEFT, pygame.K_RIGHT):
-                    delta = -1 if event.key == pygame.K_LEFT else +1
-                    if self.settings_focus_table:
-                        col = max(1, min(4, self.level_table_sel_col))
-                        lid = self.level_table_sel_row
-                        if col == 1:
-                            L = LEVELS.get(lid)
-                            if L:
-                                L.hits_required = max(1, min(999, L.hits_required + delta))
-                                if self.level == lid:
-                                    self.level_goal = L.hits_required
-                        else:
-                            self._set_level_mod_slot(lid, col - 2, delta)
-                    else:
-                        self.settings_adjust(delta)
-                    return
-
-                if event.key == pygame.K_DOWN:
-                    if self.settings_focus_table:
-                        if self.level_table_sel_col < 4:
-                            self.level_table_sel_col += 1
-                        else:
-                            if self.level_table_sel_row < self.levels_active:
-                                self.level_table_sel_row += 1
-                                self.level_table_sel_col = 1
-                        return
-                    else:
-                        last_idx = self._last_editable_settings_idx()
-                        if self.settings_idx == last_idx:
-                            if self.settings_page == 1:
-                                self.settings_focus_table = True
-                                self.level_table_sel_row = 1
-                                self.level_table_sel_col = 1
-                                self._ensure_selected_visible()
-                        else:
-                            self.settings_move(+1)
-                        return
-
-                if event.key == pygame.K_UP:
-                    if self.settings_focus_table:
-                        if self.level_table_sel_col > 1:
-                            self.level_table_sel_col -= 1
-                        else:
-                            if self.level_table_sel_row > 1:
-                                self.level_table_sel_row -= 1
-                                self.level_table_sel_col = 4
-                            else:
-                                self.settings_focus_table = False
-                                self.settings_idx = self._last_editable_settings_idx()
-                        return
-                    else:
-                        self.settings_move(-1)
-                        return
-
-            elif self.scene is Scene.INSTRUCTION:
-                if event.key in (pygame.K_RETURN, pygame.K_SPACE) or event.key in self.key_to_pos:
-                    self._enter_gameplay_after_instruction()
-                    return
+            on_key = self._scene_key_handlers.get(self.scene)
+            if on_key is not None and on_key(k):
+                return
 
-            self.keys_down.add(event.key)
-            name = self.keymap_current.get(event.key)
+            b = self._key_bit.get(k)
+            if b:
+                self._keys_mask |= b
+            name = self.keymap_current.get(k)
             if name:
-                if self.lock_until_all_released or self.now() < getattr(self, "accept_after", 0.0):
+                if self.lock_until_all_released or self.now() < self.accept_after:
                     return
                 iq.push(name)
 
         elif event.type == pygame.KEYUP:
-            self.keys_down.discard(event.key)
-            if self.lock_until_all_released and not self.keys_down and self.now() >= getattr(self, "accept_after", 0.0):
+            b = self._key_bit.get(event.key)
+            if b:
+                self._keys_mask &= ~b
+            if self.lock_until_all_released and self._keys_mask == 0 and self.now() >= self.accept_after:
                 self.lock_until_all_released = False
 
     def handle_input_symbol(self, name: str) -> None:
@@ -1520,24 +1773,23 @@ class Game:
 
         required = self.rules.apply(self.target)
         if name == required:
+            hit = self._on_correct_next or self._build_hit_policy()
             self.streak += 1
             if self.streak > self.best_streak:
                 self.best_streak = self.streak
             self.score += 1
 
             self.fx.trigger_pulse('score')
-            try:
-                hit_pos = next(p for p, s in self.ring_layout.items() if s == required)
+            hit_pos = self._ring_layout_inv.get(required)
+            if hit_pos:
                 self.fx.trigger_pulse_ring(hit_pos)
-            except StopIteration:
-                pass
             if self.sfx.get("point"): self.sfx["point"].play()
             if self.streak and self.streak % 10 == 0:
                 self.fx.trigger_pulse_streak()
 
             self.hits_in_level += 1
 
-            if self.mode is Mode.TIMED:
+            if hit.timed:
                 gain = float(self.settings.get("timed_gain", 1.0))
                 self.timer_timed.set(self.timer_timed.get() + gain)
 
@@ -1546,21 +1798,15 @@ class Game:
                 if self.timed_hits_since_roll >= max(1, every) and not self._mods_chain_active():
                     self.timed_hits_since_roll = 0
                     self._timed_roll_mod()
-
-            if self.mode is Mode.SPEEDUP:
+            else:
                 step = float(self.settings.get("target_time_step", TARGET_TIME_STEP))
                 tmin = float(self.settings.get("target_time_min", TARGET_TIME_MIN))
                 self.target_time = max(tmin, self.target_time + step)
 
-            if self.mode is Mode.TIMED:
-                for mod in mods_from_ids(self.timed_active_mods):
-                    mod.on_correct(self)
-            else:
-                resolved = getattr(self.level_cfg, "_mods_resolved", self.level_cfg.modifiers or [])
-                for mod in mods_from_ids(resolved):
-                    mod.on_correct(self)
+            for mod in hit.mods:
+                mod.on_correct(self)
 
-            if self.mode is Mode.SPEEDUP and self.hits_in_level >= self.level_goal:
+            if hit.levels_up:
                 self.pause_until = 0.0
                 self.banner.active_until = 0.0
                 self.mods_banner.active_until = 0.0
@@ -1611,9 +1857,9 @@ class Game:
         if self.scene is Scene.MENU:
             self._ensure_mode_system_ready()
             self._update_menu_mode_transition()
-            if not getattr(self, "_menu_anim", {}).get("active", False):
+            if not self._menu_anim["active"]:
                 self._render_menu_background()
-            _ = iq.pop_all()
+            iq.discard_all()
             return
 
         banner_active = self.banner.is_active(now)
@@ -1623,7 +1869,7 @@ class Game:
         self._banner_was_active = banner_active
 
         mods_active = self.mods_banner.is_active(now)
-        if getattr(self, "_mods_banner_was_active", False) and not mods_active:
+        if self._mods_banner_was_active and not mods_active:
             self._commit_queued_timed_mods()
         self._mods_banner_was_active = mods_active
 
@@ -1652,14 +1898,12 @@ class Game:
 
         # --- Pulse animation for symbol and timer (SPEEDUP) ---
         if (self.scene is Scene.GAME and self.mode is Mode.SPEEDUP
-            and self.target is not None and self.target_time > 0):
-            remaining = self.timer_speed.get()
-            left_ratio = remaining / max(1e-6, self.target_time)
-            if left_ratio <= 0.5:
-                if not self.fx.is_pulse_active('symbol'):
-                    self.fx.trigger_pulse_symbol()
-                if not self.fx.is_pulse_active('timer'):
-                    self.fx.trigger_pulse('timer')
+            and self.target is not None and self._target_halftime is not None
+            and self.timer_speed.get() <= self._target_halftime):
+            if not self.fx.is_pulse_active('symbol'):
+                self.fx.trigger_pulse_symbol()
+            if not self.fx.is_pulse_active('timer'):
+                self.fx.trigger_pulse('timer')
 
         if self.mode is Mode.TIMED and self.scene is Scene.GAME and self.timer_timed.expired():
             self.end_game()
@@ -1707,24 +1951,66 @@ class Game:
             pygame.draw.rect(rr, border, rr.get_rect(), width=border_w, border_radius=radius)
         surf.blit(rr, rect.topleft)
         
-    def _shadow_text(self, surf: pygame.Surface) -> pygame.Surface:
+    def _scratch_surface(self, w: int, h: int) -> pygame.Surface:
+        # Cleared (w, h) view into a pooled surface; only valid until the next call
+        key = (1 << max(0, w - 1).bit_length(), 1 << max(0, h - 1).bit_length())
+        pooled = self._scratch_pool.get(key)
+        if pooled is None:
+            pooled = pygame.Surface(key, pygame.SRCALPHA)
+            self._scratch_pool[key] = pooled
+        area = pygame.Rect(0, 0, w, h)
+        pooled.fill((0, 0, 0, 0), area)
+        return pooled.subsurface(area)
+
+    def _shadow_text(self, surf: pygame.Surface, *, shared: bool = False) -> pygame.Surface:
+        # shared: surf comes from _render_raw and is reused across frames, so its shadow can be too;
+        # the entry holds surf itself, so its id cannot be recycled while cached
+        if shared:
+            key = id(surf)
+            hit = self._shadow_cache.pop(key, None)
+            if hit is not None:
+                self._shadow_cache[key] = hit  # move to most-recent end
+                return hit[1]
+        # black fill MULT-blended with the text == copy + black tint, without a tint surface
         sh = pygame.Surface(surf.get_size(), pygame.SRCALPHA)
-        sh.blit(surf, (0, 0))
-        tint = pygame.Surface(surf.get_size(), pygame.SRCALPHA)
-        tint.fill((0, 0, 0, 255))
-        sh.blit(tint, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        sh.fill((0, 0, 0, 255))
+        sh.blit(surf, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        if shared:
+            if len(self._shadow_cache) >= TEXT_CACHE_MAX:
+                self._shadow_cache.pop(next(iter(self._shadow_cache)))
+            self._shadow_cache[key] = (surf, sh)
         return sh
 
     def draw_text(self, text: str, *, pos: Optional[tuple[float,float]] = None,
                 font: Optional[pygame.font.Font] = None, size_px: Optional[int] = None,
                 color=INK, shadow=True, glitch=True, scale: float = 1.0,
-                alpha: Optional[int] = None, shadow_offset=TEXT_SHADOW_OFFSET) -> pygame.Surface:
+                alpha: Optional[int] = None, shadow_offset=TEXT_SHADOW_OFFSET, atlas: bool = False) -> pygame.Surface:
         if font is None:
             px = self.px(size_px) if size_px else self.font.get_height()
             font = self._font(px)
 
         render_text = self._glitch_text(text) if (glitch and self.fx.is_text_glitch_active()) else text
-        base = font.render(render_text, True, color)
+
+        # unglitched, unscaled, opaque text is deterministic: serve it from the cache
+        key = None
+        if render_text is text and scale == 1.0 and alpha is None and not atlas:
+            key = (text, tuple(color), id(font), bool(shadow), tuple(shadow_offset))
+            cached = self._text_cache.pop(key, None)
+            if cached is not None:
+                self._text_cache[key] = cached  # move to most-recent end
+                if pos is not None:
+                    self.screen.blit(cached, (int(pos[0]), int(pos[1])))
+                return cached
+
+        # atlas: fast-changing numbers are composed from cached glyphs instead of cached whole
+        shared = False
+        if atlas:
+            base = self.glyphs.render(font, render_text, color)
+        elif render_text is text:
+            base = self._render_raw(font, text, color)
+            shared = scale == 1.0
+        else:
+            base = font.render(render_text, True, color)  # glitched strings are one-offs
 
         if scale != 1.0:
             bw, bh = base.get_size()
@@ -1733,20 +2019,42 @@ class Game:
         out = base
         if shadow:
             dx, dy = shadow_offset
-            sh = self._shadow_text(base)
-            surf = pygame.Surface((base.get_width()+max(0,int(dx)), base.get_height()+max(0,int(dy))), pygame.SRCALPHA)
+            sh = self._shadow_text(base, shared=shared)
+            size = (base.get_width()+max(0,int(dx)), base.get_height()+max(0,int(dy)))
+            # blitted right away when pos is given, so a pooled scratch surface is enough
+            pooled = pos is not None and key is None
+            surf = self._scratch_surface(*size) if pooled else pygame.Surface(size, pygame.SRCALPHA)
             surf.blit(sh, (int(dx), int(dy))); surf.blit(base, (0, 0))
             out = surf
 
         if alpha is not None:
+            if out is base:
+                out = base.copy()  # base may be shared from a cache
             out.set_alpha(alpha)
 
+        if key is not None:
+            if len(self._text_cache) >= TEXT_CACHE_MAX:
+                self._text_cache.pop(next(iter(self._text_cache)))
+            self._text_cache[key] = out
+
         if pos is not None:
             x, y = pos
             self.screen.blit(out, (int(x), int(y)))
 
         return out
 
+    def _render_raw(self, font: pygame.font.Font, text: str, color) -> pygame.Surface:
+        # plain render of a string that is usually the same next frame (HUD/menu labels, scaled or
+        # faded text); shared, so callers must not modify the returned surface
+        key = (text, tuple(color), id(font))
+        surf = self._render_cache.pop(key, None)
+        if surf is None:
+            surf = font.render(text, True, color)
+            if len(self._render_cache) >= TEXT_CACHE_MAX:
+                self._render_cache.pop(next(iter(self._render_cache)))
+        self._render_cache[key] = surf
+        return surf
+
     def draw_chip(
         self,
         text: str,
@@ -1762,17 +2070,16 @@ class Game:
         border_w: int = 1,
     ) -> pygame.Rect:
         fnt = font or self.font
-        t_surf = fnt.render(text, True, text_color)
+        t_surf = self._render_raw(fnt, text, text_color)
         w, h = t_surf.get_width() + pad * 2, t_surf.get_height() + pad * 2
 
-        chip = pygame.Surface((w, h), pygame.SRCALPHA)
-        pygame.draw.rect(chip, bg, chip.get_rect(), border_radius=radius)
-        pygame.draw.rect(chip, border, chip.get_rect(), width=border_w, border_radius=radius)
-
-        shadow = pygame.Surface((w, h), pygame.SRCALPHA)
+        shadow = self._scratch_surface(w, h)
         pygame.draw.rect(shadow, (0, 0, 0, 120), shadow.get_rect(), border_radius=radius + 2)
         self.screen.blit(shadow, (x + 3, y + 4))
 
+        chip = self._scratch_surface(w, h)
+        pygame.draw.rect(chip, bg, chip.get_rect(), border_radius=radius)
+        pygame.draw.rect(chip, border, chip.get_rect(), width=border_w, border_radius=radius)
         chip.blit(t_surf, (pad, pad))
         self.screen.blit(chip, (x, y))
         return pygame.Rect(x, y, w, h)
@@ -1812,8 +2119,7 @@ class Game:
 
     def _draw_mod_chip(self, tag: str, x: int, y: int, *, scale: float = 1.0) -> pygame.Rect:
         label = ("INVERTED" if tag == "joystick" else tag).upper()
-        col_key = "invert" if tag == "joystick" else tag
-        col = MOD_COLOR.get(col_key, INK)
+        col = MOD_COLOR_ALIASED.get(tag, INK)
         pad_x = int(self.px(8) * scale)
         pad_y = int(self.px(4) * scale)
         tw, th = self.font.size(label)
@@ -1840,8 +2146,7 @@ class Game:
         if self._timed_mods_changed_at > 0.0:
             t = self.now() - self._timed_mods_changed_at
             if t <= 0.9:
-                k = max(0.0, min(1.0, t / 0.9))
-                scale = 1.0 + (1.14 - 1.0) * (1.0 - (1.0 - k) ** 3)
+                scale = 1.0 + (1.14 - 1.0) * self._ease_out_cubic(t / 0.9)
             else:
                 self._timed_mods_changed_at = 0.0
 
@@ -1944,9 +2249,9 @@ class Game:
 
         self._level_table_cells = {}
         row_h = S(32)
-        for row in range(1, self.levels_active + 1):
-            L = LEVELS.get(row)
-            if not L:
+        levels_active = self.levels_active
+        for row, L in LEVELS.items():  # ids are added in order by ensure_level_exists
+            if row > levels_active:
                 continue
             rr = pygame.Rect(x0, y, table_w, row_h)
             self._draw_round_rect(self.screen, rr, (16,18,24,140), border=(40,60,90,140),
@@ -2005,8 +2310,12 @@ class Game:
         legend = "Legend: remap (magenta) - spin (gold) - memory (red) - inverted joystick (green) - RANDOM (cyan)"
         lw, _ = self.font.size(legend)
         legend_x = x0 + max(0, (table_w - int(lw * scale)) // 2)
-        self.draw_text(legend, pos=(legend_x, y + S(4)),
-                    color=(200,210,225), font=self.font, shadow=True, glitch=False, scale=scale)
+        legend_surf = self._legend_cache.get(scale)
+        if legend_surf is None:
+            legend_surf = self.draw_text(legend, color=(200,210,225), font=self.font,
+                                         shadow=True, glitch=False, scale=scale)
+            self._legend_cache[scale] = legend_surf
+        self.screen.blit(legend_surf, (int(legend_x), int(y + S(4))))
 
     def _levels_table_height(self) -> int:
         header_h = self.px(28)
@@ -2035,8 +2344,8 @@ class Game:
         return out
 
     def _render_title_remap_minimal(self) -> pygame.Surface:
-        left_surf  = self.big.render("REM", True, MENU_TITLE_PRIMARY_COLOR)
-        right_surf = self.big.render("P",   True, MENU_TITLE_PRIMARY_COLOR)
+        left_surf  = self._render_raw(self.big, "REM", MENU_TITLE_PRIMARY_COLOR)
+        right_surf = self._render_raw(self.big, "P",   MENU_TITLE_PRIMARY_COLOR)
 
         H = max(left_surf.get_height(), right_surf.get_height())
 
@@ -2051,7 +2360,7 @@ class Game:
         title = pygame.Surface((total_w, total_h), pygame.SRCALPHA)
 
         x = 0
-        title.blit(self._shadow_text(left_surf), (x + 2, 2))
+        title.blit(self._shadow_text(left_surf, shared=True), (x + 2, 2))
         title.blit(left_surf, (x, 0))
         x += left_surf.get_width() + gap
 
@@ -2063,7 +2372,7 @@ class Game:
         pygame.draw.polygon(title, MENU_TITLE_TRIANGLE_COLOR, [a, b, c], thickness)
         x += tri_w + gap
 
-        title.blit(self._shadow_text(right_surf), (x + 2, 2))
+        title.blit(self._shadow_text(right_surf, shared=True), (x + 2, 2))
         title.blit(right_surf, (x, 0))
 
         t = self.now()
@@ -2091,18 +2400,61 @@ class Game:
             pygame.draw.rect(surf, (color[0], color[1], color[2], alpha), surf.get_rect(), border_radius=max(8, int(rh*0.45)))
             self.screen.blit(surf, (cx - rw//2, cy - rh//2), special_flags=pygame.BLEND_PREMULTIPLIED)
 
+    def _glyph(self, key: tuple, w: int, h: int, pad: int, paint) -> tuple[pygame.Surface, tuple[int, int]]:
+        """Cached (surface, offset) for a glyph painted into a w x h rect; offset is relative to rect.topleft."""
+        hit = self._glyph_cache.pop(key, None)
+        if hit is None:
+            surf = pygame.Surface((w + 2 * pad, h + 2 * pad), pygame.SRCALPHA)
+            local = pygame.Rect(pad, pad, w, h)
+            scaled = paint(surf, local)
+            if scaled is not None:
+                # image glyphs keep just the scaled image, centered in the rect
+                surf = scaled
+                r = scaled.get_rect(center=pygame.Rect(0, 0, w, h).center)
+                hit = (surf, r.topleft)
+            else:
+                hit = (surf, (-pad, -pad))
+            if len(self._glyph_cache) >= GLYPH_CACHE_MAX:
+                self._glyph_cache.pop(next(iter(self._glyph_cache)))
+        self._glyph_cache[key] = hit
+        return hit
+
+    def _symbol_glyph(self, name: str, w: int, h: int) -> tuple[pygame.Surface, tuple[int, int]]:
+        sym = SYMBOLS.get(name)
+
+        def paint(surf: pygame.Surface, rect: pygame.Rect) -> Optional[pygame.Surface]:
+            if not sym:
+                pygame.draw.circle(surf, INK, rect.center, int(min(rect.w, rect.h)*0.3), max(1, SYMBOL_DRAW_THICKNESS))
+                return None
+            path = self.cfg.get("images", {}).get(sym.image_cfg_key)
+            img = self.images.load(path) if path else None
+            if img:
+                iw, ih = img.get_size()
+                scale = min(rect.width / iw, rect.height / ih)
+                return pygame.transform.smoothscale(img, (int(iw * scale), int(ih * scale)))
+            sym.draw(surf, rect, images=self.images, cfg=self.cfg)
+            return None
+
+        return self._glyph(("sym", name, w, h), w, h, SYMBOL_DRAW_THICKNESS, paint)
+
+    def _arrow_glyph(self, w: int, h: int, color=RULE_ARROW_COLOR, width=RULE_ARROW_W) -> tuple[pygame.Surface, tuple[int, int]]:
+        def paint(surf: pygame.Surface, rect: pygame.Rect) -> Optional[pygame.Surface]:
+            path = self.cfg.get("images", {}).get("arrow")
+            img = self.images.load(path) if path else None
+            if img:
+                iw, ih = img.get_size()
+                scale = min(rect.width / iw, rect.height / ih)
+                return pygame.transform.smoothscale(img, (int(iw * scale), int(ih * scale)))
+            self._paint_vector_arrow(surf, rect, color, width)
+            return None
+
+        return self._glyph(("arrow", w, h, tuple(color), width), w, h, width, paint)
+
     def draw_arrow(self, surface: pygame.Surface, rect: pygame.Rect, color=RULE_ARROW_COLOR, width=RULE_ARROW_W) -> None:
-        path = self.cfg.get("images", {}).get("arrow")
-        img = self.images.load(path) if path else None
-        if img:
-            iw, ih = img.get_size()
-            scale = min(rect.width / iw, rect.height / ih)
-            new_size = (int(iw * scale), int(ih * scale))
-            scaled = pygame.transform.smoothscale(img, new_size)
-            r = scaled.get_rect(center=rect.center)
-            surface.blit(scaled, r)
-            return
-        # vector fallback
+        glyph, (ox, oy) = self._arrow_glyph(rect.w, rect.h, color, width)
+        surface.blit(glyph, (rect.x + ox, rect.y + oy))
+
+    def _paint_vector_arrow(self, surface: pygame.Surface, rect: pygame.Rect, color, width: int) -> None:
         ax1 = rect.left + width
         ax2 = rect.right - width * 1.5
         ay = rect.centery
@@ -2115,11 +2467,17 @@ class Game:
         pygame.draw.polygon(surface, color, (p1, p2, p3), width)
     
     def draw_symbol(self, surface: pygame.Surface, name: str, rect: pygame.Rect) -> None:
-        sym = SYMBOLS.get(name)
-        if not sym:
-            pygame.draw.circle(surface, INK, rect.center, int(min(rect.w, rect.h)*0.3), max(1, SYMBOL_DRAW_THICKNESS))
-            return
-        sym.draw(surface, rect, images=self.images, cfg=self.cfg)
+        glyph, (ox, oy) = self._symbol_glyph(name, rect.w, rect.h)
+        surface.blit(glyph, (rect.x + ox, rect.y + oy))
+
+    def _blit_symbol_faded(self, surface: pygame.Surface, name: str, rect: pygame.Rect, alpha: int) -> pygame.Rect:
+        """draw_symbol with a surface alpha, clipped to `rect`; the cached glyph's alpha is restored after."""
+        glyph, (ox, oy) = self._symbol_glyph(name, rect.w, rect.h)
+        area = pygame.Rect(-ox, -oy, rect.w, rect.h)  # the glyph part that falls inside rect
+        glyph.set_alpha(alpha)
+        dirty = surface.blit(glyph, rect.topleft, area)
+        glyph.set_alpha(255)
+        return dirty
 
     def _draw_label_value_vstack(self, *, label: str, value: str, left: bool, anchor_rect: pygame.Rect) -> None:
         lab = self.draw_text(label,  color=HUD_LABEL_COLOR, font=self.hud_label_font, shadow=True)
@@ -2140,7 +2498,9 @@ class Game:
         self, *, label: str, value: str, anchor_rect: pygame.Rect,
         label_color: Tuple[int,int,int] = HUD_LABEL_COLOR,
         value_color: Tuple[int,int,int] = HUD_VALUE_COLOR,
+        out: Optional[list] = None,
     ) -> None:
+        """Draw a centred label/value pair; with `out`, queue the blits there instead."""
         lab = self.draw_text(label, color=label_color, font=self.hud_label_font, shadow=True)
         val = self.draw_text(value, color=value_color, font=self.hud_value_font, shadow=True)
 
@@ -2150,6 +2510,10 @@ class Game:
         lx = anchor_rect.centerx - lab.get_width() // 2
         vx = anchor_rect.centerx - val.get_width() // 2
 
+        if out is not None:
+            out.append((lab, (lx, y)))
+            out.append((val, (vx, y + lab.get_height() + gap)))
+            return
         self.screen.blit(lab, (lx, y))
         self.screen.blit(val, (vx, y + lab.get_height() + gap))
 
@@ -2180,11 +2544,21 @@ class Game:
         *,
         label_font: Optional[pygame.font.Font] = None,
     ) -> tuple[pygame.Surface, pygame.Surface]:
-        panel_scale = max(0.2, float(panel_scale))
-        symbol_scale = max(0.2, float(symbol_scale))
+        """(panel, composite): the panel is for sizing; blit the composite (shadow under panel,
+        premultiplied) at the panel position with BLEND_PREMULTIPLIED."""
+        step = RULE_PANEL_SCALE_STEP
+        panel_scale = max(0.2, round(float(panel_scale) / step) * step)
+        symbol_scale = max(0.2, round(float(symbol_scale) / step) * step)
 
         # Title
         title_font = label_font or self.mid
+
+        key = (pair[0], pair[1], round(panel_scale / step), round(symbol_scale / step), id(title_font))
+        cached = self._panel_cache.pop(key, None)
+        if cached is not None:
+            self._panel_cache[key] = cached  # move to most-recent end
+            return cached
+
         title_surf = title_font.render(RULE_BANNER_TITLE, True, ACCENT)
         title_w, title_h = title_surf.get_size()
 
@@ -2237,29 +2611,44 @@ class Game:
         arrow_rect.center = (line_left + icon_size + icon_gap + arrow_w // 2, cy)
         right_rect.center = (line_left + icon_size + icon_gap + arrow_w + icon_gap + icon_size // 2, cy)
 
-        self.draw_symbol(panel_raw, pair[0], left_rect)
-        self.draw_arrow(panel_raw, arrow_rect)
-        self.draw_symbol(panel_raw, pair[1], right_rect)
+        glyphs = []
+        for glyph_rect, (glyph, (ox, oy)) in (
+            (left_rect, self._symbol_glyph(pair[0], icon_size, icon_size)),
+            (arrow_rect, self._arrow_glyph(arrow_w, arrow_h)),
+            (right_rect, self._symbol_glyph(pair[1], icon_size, icon_size)),
+        ):
+            glyphs.append((glyph, (glyph_rect.x + ox, glyph_rect.y + oy)))
+        panel_raw.blits(glyphs, doreturn=False)
+
+        # Scale the complete panel + shadow (the flat shadow needs no filtering)
+        if (panel_w, panel_h) == (panel_w_raw, panel_h_raw):
+            panel, shadow = panel_raw, shadow_raw
+        else:
+            panel = pygame.transform.smoothscale(panel_raw, (panel_w, panel_h))
+            shadow = pygame.transform.scale(shadow_raw, (panel_w, panel_h))
 
-        # Scale the complete panel + shadow
-        panel = pygame.transform.smoothscale(panel_raw, (panel_w, panel_h))
-        shadow = pygame.transform.smoothscale(shadow_raw, (panel_w, panel_h))
-        return panel, shadow
+        # fuse shadow + panel; premultiplied "over" keeps the translucent panel over its shadow exact
+        sx, sy = RULE_PANEL_SHADOW_OFFSET
+        composite = pygame.Surface((panel_w + sx, panel_h + sy), pygame.SRCALPHA)
+        composite.blit(shadow.premul_alpha(), (sx, sy))
+        composite.blit(panel.premul_alpha(), (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
 
-    def _draw_rule_banner_anim(self) -> None:
-        pair = self.rules.current_mapping
-        if not pair:
-            return
-        now = self.now()
+        if len(self._panel_cache) >= RULE_PANEL_CACHE_MAX:
+            self._panel_cache.pop(next(iter(self._panel_cache)))
+        self._panel_cache[key] = (panel, composite)
+        return panel, composite
+
+    def _draw_rule_banner_anim(self, pair: Tuple[str, str], now: float) -> None:
         phase, p = self.banner.phase(now)
 
         mid_y = int(self.h * 0.30)
-        pinned_y = int(getattr(self, "_rule_pinned_y", self.topbar_rect.bottom + int(self.h * 0.02)))
+        pinned_y = self._rule_pinned_y
 
-        if phase == "in" and getattr(self.banner, "from_pinned", False):
-            panel_scale = RULE_BANNER_PIN_SCALE + (1.0 - RULE_BANNER_PIN_SCALE) * self._ease_out_cubic(p)
-            symbol_scale = RULE_SYMBOL_SCALE_PINNED + (RULE_SYMBOL_SCALE_CENTER - RULE_SYMBOL_SCALE_PINNED) * self._ease_out_cubic(p)
-            y = int(pinned_y + (mid_y - pinned_y) * self._ease_out_cubic(p))
+        if phase == "in" and self.banner.from_pinned:
+            k = self._ease_out_cubic(p)
+            panel_scale = RULE_BANNER_PIN_SCALE + (1.0 - RULE_BANNER_PIN_SCALE) * k
+            symbol_scale = RULE_SYMBOL_SCALE_PINNED + (RULE_SYMBOL_SCALE_CENTER - RULE_SYMBOL_SCALE_PINNED) * k
+            y = int(pinned_y + (mid_y - pinned_y) * k)
             font = self.rule_font_center
         elif phase == "in":
             panel_scale, symbol_scale, font = 1.0, RULE_SYMBOL_SCALE_CENTER, self.rule_font_center
@@ -2270,30 +2659,27 @@ class Game:
             y = mid_y
             self.banner.from_pinned = False
         else:
-            panel_scale = 1.0 + (RULE_BANNER_PIN_SCALE - 1.0) * self._ease_out_cubic(p)
-            symbol_scale = RULE_SYMBOL_SCALE_CENTER + (RULE_SYMBOL_SCALE_PINNED - RULE_SYMBOL_SCALE_CENTER) * self._ease_out_cubic(p)
-            y = int(mid_y + (pinned_y - mid_y) * self._ease_out_cubic(p))
+            k = self._ease_out_cubic(p)
+            panel_scale = 1.0 + (RULE_BANNER_PIN_SCALE - 1.0) * k
+            symbol_scale = RULE_SYMBOL_SCALE_CENTER + (RULE_SYMBOL_SCALE_PINNED - RULE_SYMBOL_SCALE_CENTER) * k
+            y = int(mid_y + (pinned_y - mid_y) * k)
             font = self.rule_font_pinned
 
         panel_scale *= self.fx.pulse_scale('banner')
-        panel, shadow = self._render_rule_panel_surface(pair, panel_scale, symbol_scale, label_font=font)
-        panel_w, panel_h = panel.get_size()
-        panel_x = (self.w - panel_w) // 2
-        self.screen.blit(shadow, (panel_x + 3, y + 5))
-        self.screen.blit(panel, (panel_x, y))
+        panel, composite = self._render_rule_panel_surface(pair, panel_scale, symbol_scale, label_font=font)
+        panel_x = (self.w - panel.get_width()) // 2
+        self.screen.blit(composite, (panel_x, y), special_flags=pygame.BLEND_PREMULTIPLIED)
 
-    def _draw_rule_banner_pinned(self) -> None:
-        pair = self.rules.current_mapping
-        if not pair:
-            return
+    def _draw_rule_banner_pinned(self, pair: Tuple[str, str]) -> None:
+        # quantized scales: pulse frames cycle through a few cached panels
         panel_scale = RULE_BANNER_PIN_SCALE * self.fx.pulse_scale('banner')
-        symbol_scale = RULE_SYMBOL_SCALE_PINNED
-        panel, shadow = self._render_rule_panel_surface(pair, panel_scale, symbol_scale, label_font=self.rule_font_pinned)
-        panel_w, panel_h = panel.get_size()
-        panel_x = (self.w - panel_w) // 2
-        panel_y = int(getattr(self, "_rule_pinned_y", self.topbar_rect.bottom + int(self.h * 0.02)))
-        self.screen.blit(shadow, (panel_x + 3, panel_y + 5))
-        self.screen.blit(panel, (panel_x, panel_y))
+        panel, composite = self._render_rule_panel_surface(
+            pair, panel_scale, RULE_SYMBOL_SCALE_PINNED, label_font=self.rule_font_pinned
+        )
+        panel_x = (self.w - panel.get_width()) // 2
+        self._dirty_rects.append(
+            self.screen.blit(composite, (panel_x, self._rule_pinned_y), special_flags=pygame.BLEND_PREMULTIPLIED)
+        )
 
     def _draw_mods_banner_anim(self) -> None:
         now = self.now()
@@ -2309,20 +2695,20 @@ class Game:
             scale = 1.0
         else:  # out
             k = self._ease_out_cubic(p)
-            pinned_y = int(getattr(self, "_rule_pinned_y", self.topbar_rect.bottom + self.px(12)))
+            pinned_y = self._rule_pinned_y
             y = int(mid_y + (pinned_y - mid_y) * k)
             scale = 1.0 - 0.08 * k
 
-        title_surf = self.rule_font_center.render(MODS_BANNER_TITLE, True, ACCENT)
+        title_surf = self._render_raw(self.rule_font_center, MODS_BANNER_TITLE, ACCENT)
         tw, th = title_surf.get_size()
 
         mods = list(self._pending_timed_mods if (self._pending_timed_mods is not None) else self.timed_active_mods)
         label = ", ".join(("INVERTED" if m=="joystick" else m).upper() for m in mods) or "NONE"
 
         info = f"for next {int(self.settings.get('timed_mod_every_hits',6))} hits"
-        info_surf = self.mid.render(info, True, (200,210,225))
+        info_surf = self._render_raw(self.mid, info, (200,210,225))
         lw, lh = self.font.size(label)
-        label_surf = self.mid.render(label, True, INK)
+        label_surf = self._render_raw(self.mid, label, INK)
 
         pad = self.px(18)
         inner_w = max(tw, label_surf.get_width(), info_surf.get_width())
@@ -2346,138 +2732,142 @@ class Game:
         self.screen.blit(shadow, (px + 3, y + 5))
         self.screen.blit(panel, (px, y))
 
-    def _draw_underline_segment_with_shadow(self, x1: int, x2: int, y: int, th: int, col) -> None:
+    def _draw_underline_segment_with_shadow(self, surf: pygame.Surface, x1: int, x2: int, y: int, th: int, col) -> None:
         if x2 < x1:
             x1, x2 = x2, x1
         sx, sy = TOPBAR_UNDERLINE_SHADOW_OFFSET
         shadow_h = th + TOPBAR_UNDERLINE_SHADOW_EXTRA_THICK
         shadow_rect = pygame.Rect(x1 + sx, y - shadow_h // 2 + sy, x2 - x1, shadow_h)
-        pygame.draw.rect(self.screen, TOPBAR_UNDERLINE_SHADOW_COLOR, shadow_rect,
-                        border_radius=TOPBAR_UNDERLINE_SHADOW_RADIUS)
-        pygame.draw.line(self.screen, col, (x1, y), (x2, y), th)
-
-    def _draw_hud(self) -> None:
-        top_bg = pygame.Surface((self.topbar_rect.width, self.topbar_rect.height), pygame.SRCALPHA)
-        top_bg.fill(SCORE_CAPSULE_BG)
-        self.screen.blit(top_bg, self.topbar_rect.topleft)
+        if TOPBAR_UNDERLINE_SHADOW_RADIUS <= 1:
+            surf.fill(TOPBAR_UNDERLINE_SHADOW_COLOR, shadow_rect)  # square corners: plain fillrect
+        else:
+            pygame.draw.rect(surf, TOPBAR_UNDERLINE_SHADOW_COLOR, shadow_rect,
+                            border_radius=TOPBAR_UNDERLINE_SHADOW_RADIUS)
+        pygame.draw.line(surf, col, (x1, y), (x2, y), th)
 
+    def _build_hud_chrome(self) -> pygame.Surface:
+        """Bake the static HUD parts (topbar, underline, score capsule) into one surface."""
         cap = self.score_capsule_rect
         y   = self.topbar_rect.bottom - TOPBAR_UNDERLINE_THICKNESS // 2
         th  = TOPBAR_UNDERLINE_THICKNESS
         col = TOPBAR_UNDERLINE_COLOR
 
+        sx, sy = SCORE_CAPSULE_SHADOW_OFFSET
+        shadow_rect = cap.move(sx, sy)
+        underline_shadow_h = th + TOPBAR_UNDERLINE_SHADOW_EXTRA_THICK
+        underline_bottom = y - underline_shadow_h // 2 + TOPBAR_UNDERLINE_SHADOW_OFFSET[1] + underline_shadow_h
+        chrome_h = max(self.topbar_rect.bottom, shadow_rect.bottom, underline_bottom)
+        chrome = pygame.Surface((self.w, chrome_h), pygame.SRCALPHA)
+
+        chrome.fill(SCORE_CAPSULE_BG, self.topbar_rect)
+
         left_end    = max(self.topbar_rect.left, cap.left - 1)
         right_start = min(self.topbar_rect.right, cap.right + 1)
         if left_end > self.topbar_rect.left:
-            self._draw_underline_segment_with_shadow(self.topbar_rect.left, left_end, y, th, col)
+            self._draw_underline_segment_with_shadow(chrome, self.topbar_rect.left, left_end, y, th, col)
         if right_start < self.topbar_rect.right:
-            self._draw_underline_segment_with_shadow(right_start, self.topbar_rect.right, y, th, col)
+            self._draw_underline_segment_with_shadow(chrome, right_start, self.topbar_rect.right, y, th, col)
 
-        # --- Streak panel (left) ---
-        pad_x = int(self.w * TOPBAR_PAD_X_FACTOR)
-        left_block = pygame.Rect(
-            pad_x, self.topbar_rect.top,
-            max(1, cap.left - pad_x * 2),
-            self.topbar_rect.height,
+        self._draw_round_rect(chrome, shadow_rect, SCORE_CAPSULE_SHADOW, radius=SCORE_CAPSULE_RADIUS + 2)
+        self._draw_round_rect(
+            chrome, cap, SCORE_CAPSULE_BG,
+            border=SCORE_CAPSULE_BORDER_COLOR, border_w=2, radius=SCORE_CAPSULE_RADIUS
         )
+        return chrome
+
+    def _draw_hud(self) -> None:
+        key = (self.w, self.h, tuple(self.topbar_rect), tuple(self.score_capsule_rect))
+        if self._hud_chrome is None or self._hud_chrome_key != key:
+            self._hud_chrome = self._build_hud_chrome()
+            self._hud_chrome_key = key
+
+        # between pulses the topbar is pixel-identical frame to frame: replay the last composite
+        streak_scale = self.fx.pulse_scale('streak')
+        pulse_scale = self.fx.pulse_scale('score')
+        top_key = (key, id(self.bg_img), self.streak, self.score, self.highscore, streak_scale, pulse_scale)
+        text_glitch = self.fx.is_text_glitch_active()
+        if self._hud_top is not None and self._hud_top_key == top_key and not text_glitch:
+            surf, pos = self._hud_top
+            self._dirty_rects.append(self.screen.blit(surf, pos))
+        else:
+            self._draw_hud_top(streak_scale, pulse_scale)
+            top = self._dirty_rects[-1].clip(self.screen.get_rect())
+            if text_glitch or not top.w or not top.h:
+                self._hud_top = None
+            else:
+                self._hud_top = (self.screen.subsurface(top).copy(), top.topleft)
+                self._hud_top_key = top_key
+
+        footer = self._hud_footer
+        if self.mode is Mode.TIMED:
+            self._draw_timed_mod_chips(footer)
+        else:
+            self._draw_lives_footer(footer)
+
+        # --- Bottom timer bar ---
+        if self.scene is Scene.GAME:
+            if self.mode is Mode.TIMED:
+                tdur = float(self.settings.get("timed_duration", TIMED_DURATION))
+                left = self.timer_timed.get()
+                self.timebar.draw(left / max(0.001, tdur), f"{left:.1f}s")
+            if self.mode is Mode.SPEEDUP and self.target_time > 0:
+                remaining = self.timer_speed.get()
+                ratio = remaining / max(0.001, self.target_time)
+                self.timebar.draw(ratio, f"{remaining:.1f}s")
+
+    def _draw_hud_top(self, streak_scale: float, pulse_scale: float) -> None:
+        """Chrome plus streak/score/highscore text; appends one dirty rect covering all of it."""
+        dirty = self.screen.blit(self._hud_chrome, (0, 0))
+
+        blits = self._hud_blit_list
+        blits.clear()
+
+        # --- Streak panel (left) ---
+        left_block = self._hud_left_block
         lab = self.draw_text("STREAK", color=HUD_LABEL_COLOR, font=self.hud_label_font, shadow=True)
         label_x = left_block.centerx - lab.get_width() // 2
         label_y = left_block.centery - lab.get_height() - 2
-        self.screen.blit(lab, (label_x, label_y))
-        scale = self.fx.pulse_scale('streak')
-        val = self.draw_text(str(self.streak), color=HUD_VALUE_COLOR, font=self.hud_value_font, shadow=True, scale=scale)
+        blits.append((lab, (label_x, label_y)))
+        val = self.draw_text(str(self.streak), color=HUD_VALUE_COLOR, font=self.hud_value_font, shadow=True,
+                             scale=streak_scale, atlas=True)
         vx = left_block.centerx - val.get_width() // 2
         vy = label_y + lab.get_height() + 2
-        self.screen.blit(val, (vx, vy))
+        blits.append((val, (vx, vy)))
 
         # --- High-score panel (right) ---
-        right_block = pygame.Rect(
-            cap.right + pad_x, self.topbar_rect.top,
-            max(1, self.w - pad_x - (cap.right + pad_x)),
-            self.topbar_rect.height,
-        )
         hs_label_color = (255, 230, 140) if self.score > self.highscore else HUD_LABEL_COLOR
         self._draw_label_value_vstack_center(
             label="HIGHSCORE",
             value=str(self.highscore),
-            anchor_rect=right_block,
+            anchor_rect=self._hud_right_block,
             label_color=hs_label_color,
             value_color=HUD_VALUE_COLOR,
+            out=blits,
         )
 
-        sx, sy = SCORE_CAPSULE_SHADOW_OFFSET
-        shadow_rect = cap.move(sx, sy)
-        self._draw_round_rect(self.screen, shadow_rect, SCORE_CAPSULE_SHADOW, radius=SCORE_CAPSULE_RADIUS + 2)
-        self._draw_round_rect(
-            self.screen, cap, SCORE_CAPSULE_BG,
-            border=SCORE_CAPSULE_BORDER_COLOR, border_w=2, radius=SCORE_CAPSULE_RADIUS
-        )
-
-        pad_in_x = self.px(12)
-        pad_in_y = self.px(10)
-        inner = cap.inflate(-pad_in_x * 2, -pad_in_y * 2)
-
-        head_h = int(inner.height * CAPSULE_HEAD_RATIO)
-        head_rect = pygame.Rect(inner.left, inner.top, inner.width, max(1, head_h))
-
-        gap = 2
-        label_h_fix = self.score_label_font.get_height()
-        value_h_fix = self.score_value_font.get_height()
-        block_h_fix = label_h_fix + gap + value_h_fix
-
-        # vertically centre the [label + value] block within head_rect
-        block_top = head_rect.top + max(0, (head_rect.height - block_h_fix) // 2)
-
         # 1) label "SCORE" (no scaling)
-        label_surf = self.score_label_font.render("SCORE", True, SCORE_LABEL_COLOR)
-        self.screen.blit(label_surf, (head_rect.centerx - label_surf.get_width() // 2, block_top))
+        label_surf = self._render_raw(self.score_label_font, "SCORE", SCORE_LABEL_COLOR)
+        label_cx, label_y = self._hud_score_label_pos
+        blits.append((label_surf, (label_cx - label_surf.get_width() // 2, label_y)))
 
-        value_rect = pygame.Rect(head_rect.left, block_top + label_h_fix + gap, head_rect.width, value_h_fix)
-        score_val_surf = self.score_value_font.render(str(self.score), True, SCORE_VALUE_COLOR)
-        pulse_scale = self.fx.pulse_scale('score')
+        value_rect = self._hud_value_rect
+        score_val_surf = self.glyphs.render(self.score_value_font, str(self.score), SCORE_VALUE_COLOR)
         if abs(pulse_scale - 1.0) > 1e-3:
             sw, sh = score_val_surf.get_size()
             score_val_surf = pygame.transform.smoothscale(
                 score_val_surf,
                 (max(1, int(sw * pulse_scale)), max(1, int(sh * pulse_scale)))
             )
-        self.screen.blit(
+        blits.append((
             score_val_surf,
             (value_rect.centerx - score_val_surf.get_width() // 2,
             value_rect.centery - score_val_surf.get_height() // 2)
-        )
-
-        footer_top = head_rect.bottom
-        footer_h   = max(1, inner.bottom - footer_top)
-        footer     = pygame.Rect(inner.left, footer_top, inner.width, footer_h)
-
-        sep_w = int(inner.width * CAPSULE_DIVIDER_WIDTH_RATIO)
-        sep_x1 = inner.centerx - sep_w // 2
-        sep_x2 = sep_x1 + sep_w
-        sep_y  = footer.top + self.px(6)
-        pygame.draw.line(self.screen, (120, 200, 255), (sep_x1, sep_y), (sep_x2, sep_y), max(1, CAPSULE_DIVIDER_THICKNESS))
+        ))
+        dirty.unionall_ip(self.screen.blits(blits))
 
-        content_top = sep_y + CAPSULE_DIVIDER_THICKNESS + self.px(6)
-        footer = pygame.Rect(inner.left, content_top, inner.width, max(0, inner.bottom - content_top))
-
-        if self.mode is Mode.TIMED:
-            self._draw_timed_mod_chips(footer)
-        else:
-            self._draw_lives_footer(footer)
-
-        margin = self.px(RULE_BANNER_PINNED_MARGIN)
-        self._rule_pinned_y = max(self.topbar_rect.bottom + self.px(8), self.score_capsule_rect.bottom + margin)
-
-        # --- Bottom timer bar ---
-        if self.scene is Scene.GAME:
-            if self.mode is Mode.TIMED:
-                tdur = float(self.settings.get("timed_duration", TIMED_DURATION))
-                left = self.timer_timed.get()
-                self.timebar.draw(left / max(0.001, tdur), f"{left:.1f}s")
-            if self.mode is Mode.SPEEDUP and self.target_time > 0:
-                remaining = self.timer_speed.get()
-                ratio = remaining / max(0.001, self.target_time)
-                self.timebar.draw(ratio, f"{remaining:.1f}s")
+        sep_a, sep_b = self._hud_sep
+        dirty.union_ip(pygame.draw.line(self.screen, (120, 200, 255), sep_a, sep_b, max(1, CAPSULE_DIVIDER_THICKNESS)))
+        self._dirty_rects.append(dirty)
 
     def _blit_bg(self):
         if self.bg_img:
@@ -2485,50 +2875,75 @@ class Game:
         else:
             self.screen.fill(BG)
 
-    def ring_colors(self) -> tuple[tuple[int,int,int], tuple[int,int,int], tuple[int,int,int]]:
-        def _lerp(a,b,t):
-            t = max(0.0, min(1.0, float(t)))
-            return (int(a[0] + (b[0]-a[0])*t),
-                    int(a[1] + (b[1]-a[1])*t),
-                    int(a[2] + (b[2]-a[2])*t))
-        def _pal(name): return RING_PALETTES[name]
-        def _lerp_pal(p1, p2, t):
-            return (_lerp(p1["base"], p2["base"], t),
-                    _lerp(p1["hi"],   p2["hi"],   t),
-                    _lerp(p1["soft"], p2["soft"], t))
+    def _blit_instruction_bg(self) -> None:
+        """Background with the instruction hint baked in, built once per layout."""
+        key = (Scene.INSTRUCTION, self.w, self.h, id(self.bg_img))
+        bg = self._scene_bg_cache.get(key)
+        if bg is None:
+            bg = pygame.Surface((self.w, self.h)).convert()
+            if self.bg_img:
+                bg.blit(self.bg_img, (0, 0))
+            else:
+                bg.fill(BG)
+            self._draw_instruction_hint(bg)
+            self._scene_bg_cache[key] = bg
+        self.screen.blit(bg, (0, 0))
+
+    def _draw_instruction_hint(self, surface: pygame.Surface) -> None:
+        # --- Hint displayed in bottom-right corner ---
+        hint = "ENTER/SPACE = start"
+        fnt  = self.hint_font
+        hw, hh = fnt.size(hint)
+        pad = self.px(14)
+        x = self.w - hw - pad
+        y = self.h - hh - pad
+        surface.blit(self._render_raw(fnt, hint, (0, 0, 0)), (x + 2, y + 2))
+        surface.blit(self._render_raw(fnt, hint, (220, 200, 120)), (x, y))
 
+    def ring_colors(self) -> tuple[tuple[int,int,int], tuple[int,int,int], tuple[int,int,int]]:
         sel = str(self.settings.get("ring_palette", "auto"))
-
+        key = (self.score, self.highscore, sel)
+        cached = self._ring_colors_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        colors = self._compute_ring_colors(sel)
+        self._ring_colors_cache = (key, colors)
+        return colors
+
+    def _compute_ring_colors(self, sel: str) -> tuple[tuple[int,int,int], tuple[int,int,int], tuple[int,int,int]]:
         if self.score > max(0, self.highscore):
-            g = _pal("gold")
-            return g["base"], g["hi"], g["soft"]
+            return RING_PALETTE_TRIPLES["gold"]
 
         if sel != "auto":
-            p = _pal(sel)
-            return p["base"], p["hi"], p["soft"]
+            return RING_PALETTE_TRIPLES[sel]
 
         hs = max(1, int(self.highscore))      
         prog = max(0.0, min(1.0, self.score / hs))
 
-        names = RING_GRADIENT_ORDER
-        if len(names) == 1:
-            p = _pal(names[0]); return p["base"], p["hi"], p["soft"]
+        stops = RING_GRADIENT
+        if len(stops) == 1:
+            return stops[0]
 
-        segs = len(names) - 1
+        segs = len(stops) - 1
         x = prog * segs
         i = min(segs - 1, int(x))
         t = x - i
-        p1 = _pal(names[i]); p2 = _pal(names[i+1])
-        return _lerp_pal(p1, p2, t)
+        (b1, h1, s1), (b2, h2, s2) = stops[i], stops[i + 1]
+        return _lerp_rgb(b1, b2, t), _lerp_rgb(h1, h2, t), _lerp_rgb(s1, s2, t)
 
     def _pick_new_ring_layout(self) -> dict[str,str]:
-        current = [self.ring_layout[p] for p in RING_POSITIONS]
-        symbols = list(SYMS)
-        while True:
-            random.shuffle(symbols)
-            if symbols != current:
-                break
-        return {pos: sym for pos, sym in zip(RING_POSITIONS, symbols)}
+        layout = self.ring_layout
+        current = tuple([layout[p] for p in RING_POSITIONS])
+        perms = self._layout_perms
+        cur = self._layout_perm_idx.get(current)
+        if cur is None:
+            symbols = random.choice(perms)
+        else:
+            # uniform over the other layouts without building the filtered list; draws the same
+            # index random.choice would on it
+            i = random.randrange(len(perms) - 1)
+            symbols = perms[i + 1 if i >= cur else i]
+        return dict(zip(RING_POSITIONS, symbols))
 
     def start_ring_rotation(self, *, dur: float = 0.8, spins: float = 2.0, swap_at: float = 0.5) -> None:
         now = self.now()
@@ -2560,71 +2975,69 @@ class Game:
         now = self.now()
         t = (now - self.rot_anim["t0"]) / self.rot_anim["dur"]
         if t >= 1.0:
-            self.ring_layout = dict(self.rot_anim["to_layout"])
-            self._recompute_keymap()
+            self._swap_ring_layout()
             self.rot_anim["active"] = False
-            self.rot_anim["swapped"] = True
             if self.level_cfg.memory_mode:
                 self._memory_start_preview(reset_moves=True, force_unhide=True)
             return 0.0
-        p = self._ease_out_cubic(max(0.0, min(1.0, t)))
-        if (not self.rot_anim["swapped"]) and t >= self.rot_anim["swap_at"]:
-            self.ring_layout = dict(self.rot_anim["to_layout"])
-            self._recompute_keymap()
-            self.rot_anim["swapped"] = True
+        p = self._ease_out_cubic(t)
+        if t >= self.rot_anim["swap_at"]:
+            self._swap_ring_layout()
         deg = 360.0 * self.rot_anim["spins"] * p
         return deg
 
+    def _swap_ring_layout(self) -> None:
+        # to_layout is a fresh dict owned by the rotation, so it is adopted without copying
+        if self.rot_anim["swapped"]:
+            return
+        self.ring_layout = self.rot_anim["to_layout"]
+        self._recompute_keymap()
+        self.rot_anim["swapped"] = True
+
     def _draw_spawn_animation(self, surface: pygame.Surface, name: str, rect: pygame.Rect) -> None:
         age = self.now() - self.symbol_spawn_time
-        t = 0.0 if SYMBOL_ANIM_TIME <= 0 else min(1.0, max(0.0, age / SYMBOL_ANIM_TIME))
-        eased = 1.0 - (1.0 - t) ** 3
+        eased = 0.0 if SYMBOL_ANIM_TIME <= 0 else self._ease_out_cubic(age / SYMBOL_ANIM_TIME)
 
-        base_size = self.w * SYMBOL_BASE_SIZE_FACTOR
+        base_size = self._symbol_size_f
         scale = SYMBOL_ANIM_START_SCALE + (1.0 - SYMBOL_ANIM_START_SCALE) * eased
         scale *= self.fx.pulse_scale('symbol')
         size = int(base_size * scale)
 
-        end_y = self.h * CENTER_Y_FACTOR
-        start_y = end_y + self.h * SYMBOL_ANIM_OFFSET_Y
+        end_y = self._center_yf
+        start_y = end_y + self._spawn_offset_y
         cy = start_y + (end_y - start_y) * eased
 
         dx, dy = self.fx.shake_offset(self.w)
 
         draw_rect = pygame.Rect(0, 0, size, size)
-        draw_rect.center = (int(self.w * 0.5 + dx), int(cy + dy))
+        draw_rect.center = (int(self._center_xf + dx), int(cy + dy))
         self.draw_symbol(surface, name, draw_rect)
+        self._dirty_rects.append(draw_rect.inflate(SYMBOL_DRAW_THICKNESS * 2, SYMBOL_DRAW_THICKNESS * 2))
 
-        if hasattr(self.fx, "is_exit_active") and self.fx.is_exit_active() and self.exit_dir_pos:
+        if self.fx.is_exit_active() and self.exit_dir_pos:
             t = self.fx.exit_progress()
             eased2 = self._ease_out_cubic(t)
 
-            dir_vec = {
-                "RIGHT": (1, 0), "LEFT": (-1, 0), "TOP": (0, -1), "BOTTOM": (0, 1)
-            }.get(self.exit_dir_pos, (0, 0))
+            dir_vec = RING_DIR_VEC.get(self.exit_dir_pos, (0, 0))
 
-            slide_dist = int(self.w * 0.35)  # distance to slide past the screen edge
+            slide_dist = self._slide_dist
             offx = int(dir_vec[0] * slide_dist * eased2)
             offy = int(dir_vec[1] * slide_dist * eased2)
 
             # fade out while sliding
             alpha = int(255 * (1.0 - eased2))
 
-            symbol_layer = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-            self.draw_symbol(symbol_layer, name, draw_rect.move(offx, offy))
-            alpha_tint = pygame.Surface(symbol_layer.get_size(), pygame.SRCALPHA)
-            alpha_tint.fill((255, 255, 255, alpha))
-            symbol_layer.blit(alpha_tint, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-            surface.blit(symbol_layer, (0, 0))
+            # cached glyph with surface alpha instead of a full-screen tint pass
+            self._dirty_rects.append(self._blit_symbol_faded(surface, name, draw_rect.move(offx, offy), alpha))
             return  # skip drawing the spawn transition twice
 
     def _draw_gameplay(self):
         self._blit_bg()
         self._draw_hud()
 
-        base_size = int(self.w * SYMBOL_BASE_SIZE_FACTOR)
+        base_size = int(self._symbol_size_f)
         base_rect = pygame.Rect(0, 0, base_size, base_size)
-        base_rect.center = (int(self.w * 0.5), int(self.h * CENTER_Y_FACTOR))
+        base_rect.center = (int(self._center_xf), int(self._center_yf))
 
         # --- Ring state ---
         spin_deg = self._update_ring_rotation_anim()
@@ -2639,46 +3052,48 @@ class Game:
                 # direction vector toward the ring position
                 cx, cy = base_rect.center
                 r = int(base_rect.width * RING_RADIUS_FACTOR)
-                target_xy = {
-                    "TOP":    (cx, cy - r),
-                    "RIGHT":  (cx + r, cy),
-                    "LEFT":   (cx - r, cy),
-                    "BOTTOM": (cx, cy + r),
-                }[self.exit_dir_pos]
+                dx, dy = RING_DIR_VEC[self.exit_dir_pos]
 
-                tx = int(cx + (target_xy[0] - cx) * 1.2 * eased)
-                ty = int(cy + (target_xy[1] - cy) * 1.2 * eased)
+                tx = int(cx + dx * r * 1.2 * eased)
+                ty = int(cy + dy * r * 1.2 * eased)
 
                 # shrink + fade
                 scale = (1.0 - 0.25 * eased) * self.fx.pulse_scale('symbol')
-                size = max(1, int(self.w * SYMBOL_BASE_SIZE_FACTOR * scale))
+                # size snapped to 4 px so the shrinking flight reuses cached glyphs
+                size = max(4, int(self._symbol_size_f * scale) & ~3)
                 rect = pygame.Rect(0, 0, size, size)
                 rect.center = (tx, ty)
 
-                tmp = pygame.Surface((size, size), pygame.SRCALPHA)
-                self.draw_symbol(tmp, self.fx.exit_symbol, tmp.get_rect())
-                tmp.set_alpha(int(255 * (1.0 - t)))
-                self.screen.blit(tmp, rect.topleft)
+                self._dirty_rects.append(
+                    self._blit_symbol_faded(self.screen, self.fx.exit_symbol, rect, int(255 * (1.0 - t)))
+                )
             else:
                 pass
         else:
             if self.target:
                 self._draw_spawn_animation(self.screen, self.target, base_rect)
 
-        if self.rules.current_mapping and not self.banner.is_active(self.now()):
-            self._draw_rule_banner_pinned()
+        pair = self.rules.current_mapping
+        if pair and not self.banner.is_active(self.now()):
+            self._draw_rule_banner_pinned(pair)
 
     def draw(self):
+        now = self.now()
+        self.fx.begin_frame(now)  # effect queries below share this timestamp
         self.fb.fill((0, 0, 0, 0))
         old_screen = self.screen
         self.screen = self.fb
+        self._dirty_rects = []
+        partial = False  # True when only the rects in _dirty_rects changed
         try:
-            if self.scene is Scene.GAME and self.rules.current_mapping and self.banner.is_active(self.now()):
+            pair = self.rules.current_mapping
+            if self.scene is Scene.GAME and pair and self.banner.is_active(now):
                 self._blit_bg()
-                self._draw_rule_banner_anim()
+                self._draw_rule_banner_anim(pair, now)
 
             elif self.scene is Scene.GAME:
                 self._draw_gameplay()
+                partial = PARTIAL_UPDATE
 
         #  =================   MENU   =================
 
@@ -2691,12 +3106,9 @@ class Game:
                 ty = int(self.h * MENU_TITLE_Y_FACTOR)
 
                 if logo_img:
-                    iw, ih = logo_img.get_size()
-                    max_w = int(self.w * 0.90)
-                    max_h = int(self.h * 0.42)
-                    s = min(max_w / max(1, iw), max_h / max(1, ih))
-                    sw, sh = max(1, int(iw * s)), max(1, int(ih * s))
-                    logo_s = pygame.transform.smoothscale(logo_img, (sw, sh))
+                    fw, fh = self.images.fit_size(logo_path, int(self.w * 0.90), int(self.h * 0.42))
+                    sw, sh = max(1, fw), max(1, fh)
+                    logo_s = self.images.load_scaled(logo_path, (sw, sh))
                     tx = (self.w - sw) // 2
                     self.screen.blit(logo_s, (tx, ty))
                     title_bottom = ty + sh
@@ -2706,7 +3118,7 @@ class Game:
                 # --- Mode badge beneath logo ---
                 mode_label = "SPEED-UP" if self.mode is Mode.SPEEDUP else "TIMED"
                 mode_text = f"Mode: {mode_label}"
-                t_surf = self.mid.render(mode_text, True, MENU_MODE_TEXT_COLOR)
+                t_surf = self._render_raw(self.mid, mode_text, MENU_MODE_TEXT_COLOR)
                 pad_x = self.px(12); pad_y = self.px(8)
                 bw = t_surf.get_width() + pad_x * 2
                 bh = t_surf.get_height() + pad_y * 2
@@ -2858,8 +3270,8 @@ class Game:
                         header_measured = True
                         continue
 
-                    label_surf = self.settings_font.render(label, True, INK)
-                    value_surf = self.settings_font.render(value, True, INK)
+                    label_surf = self._render_raw(self.settings_font, label, INK)
+                    value_surf = self._render_raw(self.settings_font, value, INK)
                     row_h = max(label_surf.get_height(), value_surf.get_height())
                     self._settings_row_tops.append((y_probe, row_h))
                     y_probe += row_h + item_spacing
@@ -2936,45 +3348,57 @@ class Game:
                 if self.tutorial:
                     self.tutorial.draw()
 
+                # title/caption may glitch, so they are always reported dirty; the hint below is static
                 title = self.instruction_text or f"LEVEL {self.level}"
                 tw, th = self.big.size(title)
                 title_y = int(self.h * 0.14)
-                self.draw_text(title, pos=(self.w/2 - tw/2, title_y), font=self.big)
+                title_pos = (self.w/2 - tw/2, title_y)
+                surf = self.draw_text(title, pos=title_pos, font=self.big)
+                self._dirty_rects.append(surf.get_rect(topleft=(int(title_pos[0]), title_y)))
 
-                if self.tutorial and getattr(self.tutorial, "caption", ""):
+                if self.tutorial and self.tutorial.caption:
                     cap = self.tutorial.caption
                     cw, ch = self.mid.size(cap)
                     cap_margin = self.px(8)
-                    self.draw_text(cap, pos=(self.w/2 - cw/2, title_y + th + cap_margin), font=self.mid, color=ACCENT)
+                    cap_pos = (self.w/2 - cw/2, title_y + th + cap_margin)
+                    surf = self.draw_text(cap, pos=cap_pos, font=self.mid, color=ACCENT)
+                    self._dirty_rects.append(surf.get_rect(topleft=(int(cap_pos[0]), int(cap_pos[1]))))
                     self.tutorial.show_caption = False
 
-                # --- Hint displayed in bottom-right corner ---
-                hint = "ENTER/SPACE = start"
-                fnt  = getattr(self, "hint_font", self.font)
-                hw, hh = fnt.size(hint)
-                pad = self.px(14)
-                x = self.w - hw - pad
-                y = self.h - hh - pad
-                self.screen.blit(fnt.render(hint, True, (0, 0, 0)), (x + 2, y + 2))
-                self.screen.blit(fnt.render(hint, True, (220, 200, 120)), (x, y))
+                if not self.tutorial:
+                    self._draw_instruction_hint(self.screen)  # otherwise baked into the tutorial background
 
                 # --- Instruction screen fade-in ---
-                t = (self.now() - getattr(self, "instruction_intro_t", 0.0)) / max(1e-6, getattr(self, "instruction_intro_dur", 0.0))
-                t = max(0.0, min(1.0, t))
+                t = (self.now() - self.instruction_intro_t) / max(1e-6, self.instruction_intro_dur)
                 alpha = int(255 * (1.0 - self._ease_out_cubic(t)))  # quick ease-out fade
                 if alpha > 0:
-                    overlay = pygame.Surface((self.w, self.h))
-                    overlay.set_alpha(alpha)
-                    overlay.fill((0, 0, 0))
-                    self.screen.blit(overlay, (0, 0))
+                    self._black_overlay.set_alpha(alpha)
+                    self.screen.blit(self._black_overlay, (0, 0))
+                else:
+                    partial = PARTIAL_UPDATE and self.tutorial is not None
 
         finally:
             self.screen = old_screen
 
         # post FX + present
+        partial = partial and not self.fx.is_screen_glitch_active()
         final_surface = self.fx.apply_postprocess(self.fb, self.w, self.h)
-        self.screen.blit(final_surface, (0, 0))
-        pygame.display.flip()
+        rects = None
+        if partial and self._dirty_prev is not None and self._dirty_scene is self.scene:
+            rects = self._dirty_rects + self._dirty_prev
+            if sum(r.w * r.h for r in rects) > self.w * self.h * PARTIAL_UPDATE_MAX_AREA:
+                rects = None  # mostly dirty anyway: one flip is cheaper than many small copies
+        if rects is not None:
+            # static background: only repaint what changed this frame or the last
+            for r in rects:
+                self.screen.blit(final_surface, r, r)
+            pygame.display.update(rects)
+        else:
+            self.screen.blit(final_surface, (0, 0))
+            pygame.display.flip()
+        self._dirty_prev = self._dirty_rects if partial else None
+        self._dirty_scene = self.scene
+        self.fx.end_frame()
 
 
 
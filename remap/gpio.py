@@ -19,7 +19,7 @@ except Exception:  # pragma: no cover - gpiozero is optional
     Button = None  # type: ignore
 
 
-@dataclass
+@dataclass(slots=True)
 class Pins:
     CIRCLE: int
     CROSS: int
@@ -9,6 +9,7 @@ import pygame
 class ImageStore:
     def __init__(self) -> None:
         self.cache: dict[str, pygame.Surface] = {}
+        self.scaled: dict[tuple[str, tuple[int, int]], pygame.Surface] = {}
 
     def load(self, path: str, *, allow_alpha: bool = True) -> Optional[pygame.Surface]:
         if not path:
@@ -24,8 +25,62 @@ class ImageStore:
         except Exception:
             return None
 
+    def load_scaled(self, path: str, size: tuple[int, int]) -> Optional[pygame.Surface]:
+        """Smoothscaled copy of `load(path)` at exactly `size`, memoized per (path, size)."""
+        if not path:
+            return None
+        key = (os.path.normpath(path), (int(size[0]), int(size[1])))
+        img = self.scaled.get(key)
+        if img is None:
+            src = self.load(path)
+            if src is None:
+                return None
+            img = src if src.get_size() == key[1] else pygame.transform.smoothscale(src, key[1])
+            self.scaled[key] = img
+        return img
+
+    def fit_size(self, path: str, w: float, h: float) -> Optional[tuple[int, int]]:
+        """Largest aspect-preserving size of the image at `path` that fits in w x h."""
+        src = self.load(path) if path else None
+        if src is None:
+            return None
+        iw, ih = src.get_size()
+        scale = min(w / iw, h / ih)
+        return int(iw * scale), int(ih * scale)
+
+
+class GlyphAtlas:
+    """Per-(font, color) cache of single-character renders, composed into strings by blitting.
+
+    Meant for short, fast-changing strings (score, timer) so FreeType only
+    rasterizes each character once; glyphs are placed by advance, without kerning.
+    """
+
+    def __init__(self) -> None:
+        self.cache: dict[tuple[int, tuple], dict[str, tuple[pygame.Surface, int]]] = {}
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+    def render(self, font: pygame.font.Font, text: str, color) -> pygame.Surface:
+        glyphs = self.cache.setdefault((id(font), tuple(color)), {})
+        seq = []
+        x = width = 0
+        for ch in text:
+            g = glyphs.get(ch)
+            if g is None:
+                metrics = font.metrics(ch)
+                advance = metrics[0][4] if metrics and metrics[0] else font.size(ch)[0]
+                g = glyphs[ch] = (font.render(ch, True, color), advance)
+            seq.append((g[0], (x, 0)))
+            width = max(width, x + g[0].get_width())
+            x += g[1]
+        out = pygame.Surface((max(1, width), font.get_height()), pygame.SRCALPHA)
+        out.blits(seq, doreturn=False)
+        return out
+
 
 IMAGES = ImageStore()
 
-__all__ = ["ImageStore", "IMAGES"]
+__all__ = ["ImageStore", "IMAGES", "GlyphAtlas"]
 
@@ -12,10 +12,18 @@ class InputQueue:
         self._q.append(name)
 
     def pop_all(self) -> list[str]:
-        out: List[str] = list(self._q)
-        self._q.clear()
+        q = self._q
+        if not q:
+            return []
+        # drain with popleft (atomic) so a push from the GPIO thread mid-drain is kept for next poll
+        popleft = q.popleft
+        out: List[str] = [popleft() for _ in range(len(q))]
         return out
 
+    def discard_all(self) -> None:
+        # deque.clear is a single C call; use where the inputs would be dropped anyway
+        self._q.clear()
+
 
 __all__ = ["InputQueue"]
 
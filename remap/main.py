@@ -5,7 +5,7 @@ import sys
 
 import pygame
 
-from .config import CFG
+from .config import CFG, flush_config
 from .constants import FPS
 from .game import Game
 from .gpio import init_gpio
@@ -33,7 +33,8 @@ def main():
             game.handle_event(event, iq)
         game.update(iq)
         game.draw()
-        game.clock.tick(int(game.settings.get("fps", FPS)))
+        flush_config()  # settings/highscore writes queued by this frame's handlers
+        game.pacer.tick(int(game.settings.get("fps", FPS)))
 
 if __name__ == "__main__":
     try:
@@ -4,6 +4,7 @@ import random
 from typing import Dict, List, Optional, Tuple
 
 from .models import RuleSpec, RuleType
+from .symbols import SYM_MINUS, SYM_MINUS2, SYMS
 
 
 class RuleManager:
@@ -34,9 +35,14 @@ class RuleManager:
 
     def roll_mapping(self, syms: List[str]) -> Tuple[str, str]:
         a = random.choice(syms)
-        b_choices = [s for s in syms if s != a]
-        if self.current_mapping and self.current_mapping[0] == a:
-            b_choices = [s for s in b_choices if s != self.current_mapping[1]] or b_choices
+        if syms is SYMS:
+            b_choices = SYM_MINUS[a]
+            if self.current_mapping and self.current_mapping[0] == a:
+                b_choices = SYM_MINUS2.get((a, self.current_mapping[1])) or b_choices
+        else:
+            b_choices = [s for s in syms if s != a]
+            if self.current_mapping and self.current_mapping[0] == a:
+                b_choices = [s for s in b_choices if s != self.current_mapping[1]] or b_choices
         b = random.choice(b_choices)
         self.current_mapping = (a, b)
         return self.current_mapping
@@ -66,6 +72,8 @@ class BannerManager:
         self.active_until = now + self.total
 
     def phase(self, now: float) -> Tuple[str, float]:
+        if now - self.anim_start >= self.total and self.out_sec > 0.0:
+            return "out", 1.0  # finished: skip the clamping and phase arithmetic
         t = max(0.0, min(self.total, now - self.anim_start))
         if t <= self.in_sec:
             return "in", (t / max(1e-6, self.in_sec))
@@ -24,7 +24,7 @@ class RuleType(Enum):
     MAPPING = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class RuleSpec:
     type: RuleType
     banner_on_level_start: bool = False
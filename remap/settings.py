@@ -23,17 +23,30 @@ def make_runtime_settings(CFG: Dict[str, Any]) -> Dict[str, Any]:
 
 # ------------- Clamp values for the UI -------------
 
+# (key, default, lo, hi, type); target_time_min is capped by target_time_initial separately
+_CLAMP_SPEC = (
+    ("target_time_initial", 3,     0.2,  10.0, float),
+    ("target_time_step",    -0.03, -1.0, 1.0,  float),
+    ("lives",               3,     0,    9,    int),
+    ("music_volume",        0.5,   0.0,  1.0,  float),
+    ("sfx_volume",          0.8,   0.0,  1.0,  float),
+    ("timed_rule_bonus",    5.0,   0.0,  30.0, float),
+    ("rule_font_center",    64,    8,    200,  int),
+    ("rule_font_pinned",    40,    8,    200,  int),
+)
+
+
 def clamp_settings(s: Dict[str, Any]) -> None:
     """Clamp values to the same ranges enforced by remap.config._sanitize_cfg()."""
-    s["target_time_initial"] = max(0.2, min(10.0, float(s.get("target_time_initial", 3))))
-    s["target_time_min"]     = max(0.1, min(float(s["target_time_initial"]), float(s.get("target_time_min", 0.45))))
-    s["target_time_step"]    = max(-1.0, min(1.0, float(s.get("target_time_step", -0.03))))
-    s["lives"]               = max(0, min(9, int(s.get("lives", 3))))
-    s["music_volume"]        = max(0.0, min(1.0, float(s.get("music_volume", 0.5))))
-    s["sfx_volume"]          = max(0.0, min(1.0, float(s.get("sfx_volume",   0.8))))
-    s["timed_rule_bonus"]    = max(0.0, min(30.0, float(s.get("timed_rule_bonus", 5.0))))
-    s["rule_font_center"]    = max(8,  min(200, int(s.get("rule_font_center", 64))))
-    s["rule_font_pinned"]    = max(8,  min(200, int(s.get("rule_font_pinned", 40))))
+    for key, default, lo, hi, cast in _CLAMP_SPEC:
+        v = s.get(key, default)
+        if type(v) is not cast:
+            v = cast(v)
+        s[key] = lo if v < lo else (hi if v > hi else v)
+    v = s.get("target_time_min", 0.45)
+    if type(v) is not float:
+        v = float(v)
+    s["target_time_min"] = max(0.1, min(s["target_time_initial"], v))
     # booleans/strings are taken as-is
 
 # ------------- Persist to config.json -------------
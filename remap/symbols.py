@@ -1,7 +1,7 @@
 ﻿from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import pygame
 
@@ -74,5 +74,11 @@ SYMBOLS: Dict[str, Symbol] = {
 
 SYMS: List[str] = list(SYMBOLS.keys())
 
-__all__ = ["Symbol", "SYMBOLS", "SYMS"]
+# symbols other than one / two given ones, in SYMS order (target and remap rolls)
+SYM_MINUS: Dict[str, Tuple[str, ...]] = {a: tuple(s for s in SYMS if s != a) for a in SYMS}
+SYM_MINUS2: Dict[Tuple[str, str], Tuple[str, ...]] = {
+    (a, b): tuple(s for s in SYMS if s not in (a, b)) for a in SYMS for b in SYMS if a != b
+}
+
+__all__ = ["Symbol", "SYMBOLS", "SYMS", "SYM_MINUS", "SYM_MINUS2"]
 
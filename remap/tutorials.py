@@ -1,19 +1,20 @@
 ﻿from __future__ import annotations
 
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, List, Optional, Tuple
 
 import pygame
 
 from .constants import *  # noqa: F401,F403
-from .symbols import SYMS
+from .fx import ease_out_cubic
+from .symbols import SYM_MINUS, SYM_MINUS2, SYMS
 
 if TYPE_CHECKING:
     from .game import Game
 
 
-@dataclass
+@dataclass(slots=True)
 class DemoItem:
     at: float
     symbol: str
@@ -22,6 +23,10 @@ class DemoItem:
     use_mapping: bool = False
     rotate_ring: bool = False
     tail_sec: float = 0.20
+    inv_slide_duration: float = field(init=False, repr=False)  # 1/slide_duration, 0.0 when the slide is instant
+
+    def __post_init__(self) -> None:
+        self.inv_slide_duration = 1.0 / self.slide_duration if self.slide_duration > 0.0 else 0.0
 
 
 class TutorialPlayer:
@@ -43,9 +48,14 @@ class TutorialPlayer:
 
         self.t0 = game.now()
         self.ring_layout: dict[str, str] = dict(game.ring_layout)
+        self._ring_layout_inv: dict[str, str] = {sym: pos for pos, sym in self.ring_layout.items()}  # symbol -> ring position
         self.items = sorted(items, key=lambda item: item.at)
+        self._item_at: List[float] = [max(0.0, item.at) for item in self.items]  # clamped spawn times (sequential mode)
         self._spawned_idx = -1
-        self._active: List[dict] = []
+        # active demo instances as parallel lists (item, spawn time, slide start or None)
+        self._act_items: List[DemoItem] = []
+        self._act_started: List[float] = []
+        self._act_slide_start: List[Optional[float]] = []
         self._finished = False
 
         self.mapping_pair = mapping_pair
@@ -56,65 +66,65 @@ class TutorialPlayer:
         self.sequential = bool(sequential)
         self.seq_gap = float(seq_gap)
         self._next_ready_at = self.t0
+        self._blit_batch: List[tuple] = []  # per-frame blits() entries, flushed by draw()
 
     def _pos_for_symbol(self, sym: str) -> str:
-        return next(pos for pos, symbol in self.ring_layout.items() if symbol == sym)
+        return self._ring_layout_inv[sym]
 
     def _target_for(self, sym: str, use_mapping: bool) -> str:
         if use_mapping and self.mapping_pair and sym == self.mapping_pair[0]:
             return self._pos_for_symbol(self.mapping_pair[1])
         return self._pos_for_symbol(sym)
 
-    def update(self) -> None:
-        now = self.g.now()
+    def update(self, now: Optional[float] = None) -> None:
+        if now is None:
+            now = self.g.now()
         t = now - self.t0
 
-        still: List[dict] = []
-        for inst in self._active:
-            item: DemoItem = inst["item"]
-            started = inst["started"]
-            slide_start = inst["slide_start"]
+        items, started, slide_starts = self._act_items, self._act_started, self._act_slide_start
+        before = bool(items)
+        keep = 0
+        for i in range(len(items)):
+            item = items[i]
+            slide_start = slide_starts[i]
 
-            if slide_start is None and (now - started) >= max(0.0, item.slide_delay):
-                inst["slide_start"] = now
+            if slide_start is None and (now - started[i]) >= max(0.0, item.slide_delay):
                 slide_start = now
 
-            tail = item.tail_sec
-            if slide_start is None:
-                lifetime = now - started
-            else:
-                lifetime = now - slide_start
-
-            if lifetime <= item.slide_duration + tail:
-                still.append(inst)
-
-        before = bool(self._active)
-        self._active = still
-
+            lifetime = now - (started[i] if slide_start is None else slide_start)
+            if lifetime <= item.slide_duration + item.tail_sec:
+                # compact survivors in place
+                items[keep] = item
+                started[keep] = started[i]
+                slide_starts[keep] = slide_start
+                keep += 1
+        del items[keep:], started[keep:], slide_starts[keep:]
+
+        # spawn queue state in locals; _spawned_idx is written back once below
+        queue = self.items
+        n = len(queue)
+        nxt_idx = self._spawned_idx + 1
         if self.sequential:
-            if not before and self._spawned_idx + 1 < len(self.items):
+            if not before and nxt_idx < n:
                 self._next_ready_at = now + self.seq_gap
-            while (self._spawned_idx + 1) < len(self.items):
-                nxt = self.items[self._spawned_idx + 1]
-                if t >= max(nxt.at, 0.0) and now >= self._next_ready_at:
-                    self._spawned_idx += 1
-                    inst = {"item": nxt, "started": now, "slide_start": None}
-                    self._active.append(inst)
-                else:
-                    break
+            if now >= self._next_ready_at:
+                item_at = self._item_at
+                while nxt_idx < n and t >= item_at[nxt_idx]:
+                    items.append(queue[nxt_idx]); started.append(now); slide_starts.append(None)
+                    nxt_idx += 1
         else:
-            while (self._spawned_idx + 1) < len(self.items) and self.items[self._spawned_idx + 1].at <= t:
-                self._spawned_idx += 1
-                inst = {"item": self.items[self._spawned_idx], "started": now, "slide_start": None}
-                self._active.append(inst)
+            while nxt_idx < n and queue[nxt_idx].at <= t:
+                items.append(queue[nxt_idx]); started.append(now); slide_starts.append(None)
+                nxt_idx += 1
+        self._spawned_idx = nxt_idx - 1
 
-        if (self._spawned_idx + 1) >= len(self.items) and not self._active:
+        if nxt_idx >= n and not items:
             self._finished = True
 
     def is_finished(self) -> bool:
         return bool(self._finished)
 
-    def _draw_mapping_banner(self) -> None:
+    def _draw_mapping_banner(self, now: float) -> None:
         if not (self.mapping_pair and self.show_mapping_banner and self.banner_start_t is not None):
             return
 
@@ -127,7 +137,7 @@ class TutorialPlayer:
 
             panel_scale = RULE_BANNER_PIN_SCALE * g.fx.pulse_scale("banner")
             symbol_scale = RULE_SYMBOL_SCALE_PINNED
-            panel, shadow = g._render_rule_panel_surface(
+            panel, composite = g._render_rule_panel_surface(
                 self.mapping_pair, panel_scale, symbol_scale, label_font=g.rule_font_pinned
             )
             pw, ph = panel.get_size()
@@ -140,16 +150,14 @@ class TutorialPlayer:
             py = cy - r - ph - margin - lift
             py = max(safe_top, py)
 
-            g.screen.blit(shadow, (px + 3, py + 5))
-            g.screen.blit(panel, (px, py))
+            self._blit_batch.append((composite, (px, py), None, pygame.BLEND_PREMULTIPLIED))
             return
 
-        now = g.now()
         elapsed = now - self.banner_start_t
         IN, HOLD, OUT = RULE_BANNER_IN_SEC, RULE_BANNER_HOLD_SEC, RULE_BANNER_TO_TOP_SEC
         total = IN + HOLD + OUT
         if elapsed > total:
-            panel, shadow = g._render_rule_panel_surface(
+            panel, composite = g._render_rule_panel_surface(
                 self.mapping_pair,
                 RULE_BANNER_PIN_SCALE,
                 RULE_SYMBOL_SCALE_PINNED,
@@ -157,9 +165,8 @@ class TutorialPlayer:
             )
             pw, ph = panel.get_size()
             px = (g.w - pw) // 2
-            py = int(getattr(g, "_rule_pinned_y", g.topbar_rect.bottom + g.px(12)))
-            g.screen.blit(shadow, (px + 3, py + 5))
-            g.screen.blit(panel, (px, py))
+            py = g._rule_pinned_y
+            self._blit_batch.append((composite, (px, py), None, pygame.BLEND_PREMULTIPLIED))
             return
 
         if elapsed <= IN:
@@ -180,67 +187,60 @@ class TutorialPlayer:
             panel_scale = 1.0 + (RULE_BANNER_PIN_SCALE - 1.0) * p
             symbol_scale = RULE_SYMBOL_SCALE_CENTER + (RULE_SYMBOL_SCALE_PINNED - RULE_SYMBOL_SCALE_CENTER) * p
             mid_y = int(g.h * 0.30)
-            pinned_y = int(getattr(g, "_rule_pinned_y", g.topbar_rect.bottom + g.px(12)))
+            pinned_y = g._rule_pinned_y
             y = int(mid_y + (pinned_y - mid_y) * p)
             font = g.rule_font_pinned
 
-        panel, shadow = g._render_rule_panel_surface(self.mapping_pair, panel_scale, symbol_scale, label_font=font)
-        pw, ph = panel.get_size()
-        px = (g.w - pw) // 2
-        g.screen.blit(shadow, (px + 3, y + 5))
-        g.screen.blit(panel, (px, y))
+        panel, composite = g._render_rule_panel_surface(self.mapping_pair, panel_scale, symbol_scale, label_font=font)
+        px = (g.w - panel.get_width()) // 2
+        self._blit_batch.append((composite, (px, y), None, pygame.BLEND_PREMULTIPLIED))
 
     def draw(self) -> None:
         g = self.g
-        now = g.now()
-        self.update()
+        now = g.now()  # one clock read per frame, shared by update, banner and slides
+        self.update(now)
+        batch = self._blit_batch
+        batch.clear()
 
-        g._blit_bg()
+        g._blit_instruction_bg()
         base_size = int(g.w * SYMBOL_BASE_SIZE_FACTOR)
         cx, cy = int(g.w * 0.5), int(g.h * CENTER_Y_FACTOR)
         g.ring.draw((cx, cy), base_size, layout=self.ring_layout, spin_deg=0.0)
 
         try:
-            self._draw_mapping_banner()
+            self._draw_mapping_banner(now)
         except Exception:
             pass
 
-        for inst in self._active:
-            item: DemoItem = inst["item"]
-            started: float = inst["started"]
-            slide_start = inst.get("slide_start")
-            start_x, start_y = cx, cy
-            target_pos = self._target_for(item.symbol, item.use_mapping)
-            ring_radius = int(base_size * RING_RADIUS_FACTOR)
-            pos_xy = {
-                "TOP": (cx, cy - ring_radius),
-                "RIGHT": (cx + ring_radius, cy),
-                "LEFT": (cx - ring_radius, cy),
-                "BOTTOM": (cx, cy + ring_radius),
-            }
-            end_x, end_y = pos_xy.get(target_pos, (cx, cy))
-
-            if slide_start is None or item.slide_duration <= 0.0:
-                progress = 0.0
-            else:
-                t = max(0.0, min(1.0, (now - slide_start) / max(1e-6, item.slide_duration)))
-                progress = g._ease_out_cubic(t)
-
-            x = int(start_x + (end_x - start_x) * progress)
-            y = int(start_y + (end_y - start_y) * progress)
-            scale = 1.0 - 0.12 * progress
-
-            size = max(1, int(g.w * SYMBOL_BASE_SIZE_FACTOR * scale))
-            rect = pygame.Rect(0, 0, size, size)
-            rect.center = (x, y)
-            g.draw_symbol(g.screen, item.symbol, rect)
+        for name, x, y, size in self._advance(now, cx, cy, g.w * SYMBOL_BASE_SIZE_FACTOR):
+            glyph, (ox, oy) = g._symbol_glyph(name, size, size)
+            batch.append((glyph, (x - size // 2 + ox, y - size // 2 + oy)))
+
+        g._dirty_rects.extend(g.screen.blits(batch))
+
+    def _advance(self, now: float, cx: int, cy: int, base_f: float) -> List[Tuple[str, int, int, int]]:
+        """Per active demo: (symbol, centre x, centre y, size) for this frame."""
+        pos_xy = self.g._ring_pos
+        target_for = self._target_for
+        ease = ease_out_cubic
+        out = []
+        for item, slide_start in zip(self._act_items, self._act_slide_start):
+            end_x, end_y = pos_xy.get(target_for(item.symbol, item.use_mapping), (cx, cy))
+
+            # ease_out_cubic clamps, so an instant slide (inverse 0.0) stays at the start
+            progress = 0.0 if slide_start is None else ease((now - slide_start) * item.inv_slide_duration)
+
+            size = max(1, int(base_f * (1.0 - 0.12 * progress)))
+            out.append((item.symbol, int(cx + (end_x - cx) * progress), int(cy + (end_y - cy) * progress), size))
+        return out
 
     def rewind_to_start(self) -> None:
-        self._active.clear()
+        self._act_items.clear()
+        self._act_started.clear()
+        self._act_slide_start.clear()
         self._spawned_idx = -1
         self._finished = False
-        self.banner_start_t = self.g.now()
-        self.t0 = self.g.now()
+        self.banner_start_t = self.t0 = self.g.now()
 
 
 def build_tutorial_from_state(
@@ -268,11 +268,6 @@ def build_tutorial_from_state(
         parts.append("Controls flipped")
     caption = " + ".join(parts) if parts else "Classic"
 
-    def sym(exclude: set[str] | None = None) -> str:
-        exclude = exclude or set()
-        choices = [s for s in SYMS if s not in exclude]
-        return random.choice(choices) if choices else random.choice(SYMS)
-
     items: List[DemoItem] = []
     mapping_pair: Optional[Tuple[str, str]] = None
 
@@ -280,19 +275,19 @@ def build_tutorial_from_state(
         if mapping:
             a, b = mapping
         else:
-            a = sym()
-            b = sym({a})
+            a = random.choice(SYMS)
+            b = random.choice(SYM_MINUS[a])
         mapping_pair = (a, b)
-        neutral = sym({a, b})
+        neutral = random.choice(SYM_MINUS2.get((a, b)) or SYM_MINUS[a])  # a mapping is never a -> a
         items += [
             DemoItem(at=0.0, symbol=a, slide_delay=1.0, slide_duration=0.60, use_mapping=True, rotate_ring=False),
             DemoItem(at=0.0, symbol=neutral, slide_delay=1.0, slide_duration=0.60, use_mapping=False, rotate_ring=False),
             DemoItem(at=0.0, symbol=a, slide_delay=1.0, slide_duration=0.60, use_mapping=True, rotate_ring=False),
         ]
     else:
-        x = sym()
-        y = sym({x})
-        z = sym({x, y})
+        x = random.choice(SYMS)
+        y = random.choice(SYM_MINUS[x])
+        z = random.choice(SYM_MINUS2[(x, y)])
         items += [
             DemoItem(at=0.0, symbol=x, slide_delay=1.0, slide_duration=0.60),
             DemoItem(at=0.0, symbol=y, slide_delay=1.0, slide_duration=0.60),
@@ -12,9 +12,49 @@ if TYPE_CHECKING:
     from .game import Game
 
 
+# (cos, sin) of the three orbit-dot offsets (0, 120, 240 degrees); each frame rotates them by one angle
+_ORBIT_OFFSETS = tuple((math.cos(k * 2 * math.pi / 3), math.sin(k * 2 * math.pi / 3)) for k in range(3))
+
+# dash (start, end) radians per (dash_deg, gap_deg); the l5 spin ring redraws them every frame
+_DASH_SEGMENTS: dict[tuple[float, float], tuple[tuple[float, float], ...]] = {}
+
+
+def _dash_segments(dash_deg: float, gap_deg: float) -> tuple[tuple[float, float], ...]:
+    # (start, end) radians of each dash; the last one is clipped at a full turn
+    segs = _DASH_SEGMENTS.get((dash_deg, gap_deg))
+    if segs is None:
+        step = dash_deg + gap_deg
+        n = int(math.ceil(360 / step))
+        segs = tuple(
+            (math.radians(i * step), math.radians(min(360, i * step + dash_deg))) for i in range(n)
+        )
+        _DASH_SEGMENTS[(dash_deg, gap_deg)] = segs
+    return segs
+
+
 class InputRing:
     def __init__(self, game: "Game") -> None:
         self.g = game
+        self._layer_cache: dict[tuple, pygame.Surface] = {}  # static vector layers by (name, side, r, colors)
+        self._scratch_layers: dict[str, pygame.Surface] = {}  # per-frame layers, reused and cleared each draw
+
+    def _layer(self, key: tuple, side: int, build: Callable[[pygame.Surface], None]) -> pygame.Surface:
+        surf = self._layer_cache.get(key)
+        if surf is None:
+            if len(self._layer_cache) >= RING_LAYER_CACHE_MAX:
+                self._layer_cache.clear()  # old palette/size entries; the current ones rebuild once
+            surf = pygame.Surface((side, side), pygame.SRCALPHA)
+            build(surf)
+            self._layer_cache[key] = surf
+        return surf
+
+    def _scratch(self, name: str, side: int) -> pygame.Surface:
+        surf = self._scratch_layers.get(name)
+        if surf is None or surf.get_width() != side:
+            surf = self._scratch_layers[name] = pygame.Surface((side, side), pygame.SRCALPHA)
+        else:
+            surf.fill((0, 0, 0, 0))
+        return surf
 
     def draw(
         self,
@@ -30,69 +70,84 @@ class InputRing:
 
         base, hi, soft = g.ring_colors()
 
-        t = g.now() - getattr(g, "_ring_anim_start", g.now())
+        t = g.now() - g._ring_anim_start
         base_ccw = 60 + 8 * (g.level - 1)
         rot_ccw_deg = t * base_ccw
 
         margin = 36
         side = (r + margin) * 2
+        # nothing of the ring can land on screen (e.g. mid slide-out): skip building the layers
+        reach = side if abs(spin_deg) > 0.0001 else side // 2  # rotozoom grows the square up to sqrt(2)
+        if not g.screen.get_clip().colliderect((cx - reach, cy - reach, reach * 2, reach * 2)):
+            return
         C = side // 2
-        out = pygame.Surface((side, side), pygame.SRCALPHA)
+        out = self._scratch("out", side)
 
         def blit_to_out(surf: pygame.Surface) -> None:
             out.blit(surf, surf.get_rect(center=(C, C)))
 
         ring_path = g.cfg.get("images", {}).get("ring")
-        ring_img = g.images.load(ring_path) if ring_path else None
+        ring_fit = g.images.fit_size(ring_path, r * 2, r * 2) if ring_path else None
 
-        if ring_img:
-            iw, ih = ring_img.get_size()
-            scale = (r * 2) / max(iw, ih)
-            ring_scaled = pygame.transform.smoothscale(ring_img, (int(iw * scale), int(ih * scale)))
-            blit_to_out(ring_scaled)
+        if ring_fit:
+            blit_to_out(g.images.load_scaled(ring_path, ring_fit))
         else:
+            # static geometry is cached per (side, r, palette); only rotation and orbit dots are per frame.
+            # Blit order matches the original stack: each layer once as drawn, then its rotated /
+            # repeated copy on top (l2, l5 unrotated + rotated; l3, l4 twice). Rotation never goes
+            # through rotozoom: l2 is concentric circles (rotation-invariant) and the l5 dashes are
+            # redrawn at the rotated start angle, which is exact and needs no per-angle surfaces.
             layers: list[pygame.Surface] = []
+            geo = (side, r, base, hi, soft)
 
-            def new_layer() -> pygame.Surface:
-                surf = pygame.Surface((side, side), pygame.SRCALPHA)
-                layers.append(surf)
-                return surf
+            def build_l1(l1: pygame.Surface) -> None:
+                pygame.draw.circle(l1, (*base, 200), (C, C), r, width=6)
+                pygame.draw.circle(l1, (*hi, 220), (C, C), int(r * RING_RING_INNER_SCALE), width=4)
+                pygame.draw.circle(l1, (*soft, 150), (C, C), int(r * RING_RING_OUTER_SCALE), width=2)
 
-            l1 = new_layer()
-            pygame.draw.circle(l1, (*base, 200), (C, C), r, width=6)
-            pygame.draw.circle(l1, (*hi, 220), (C, C), int(r * RING_RING_INNER_SCALE), width=4)
-            pygame.draw.circle(l1, (*soft, 150), (C, C), int(r * RING_RING_OUTER_SCALE), width=2)
-
-            l2 = new_layer()
-            pygame.draw.circle(l2, (*hi, 200), (C, C), int(r * RING_RING_INNER_SCALE * 0.9), width=2)
-            pygame.draw.circle(l2, (*hi, 140), (C, C), int(r * RING_RING_OUTER_SCALE * 1.05), width=1)
-            l2 = pygame.transform.rotozoom(l2, rot_ccw_deg * 0.75, 1.0)
+            def build_l2(l2: pygame.Surface) -> None:
+                pygame.draw.circle(l2, (*hi, 200), (C, C), int(r * RING_RING_INNER_SCALE * 0.9), width=2)
+                pygame.draw.circle(l2, (*hi, 140), (C, C), int(r * RING_RING_OUTER_SCALE * 1.05), width=1)
 
+            layers.append(self._layer(("l1",) + geo, side, build_l1))
+            l2 = self._layer(("l2",) + geo, side, build_l2)
+            layers.append(l2)
             layers.append(l2)
 
             if g.level >= 3:
-                l3 = new_layer()
-                rect = pygame.Rect(0, 0, r * 2, r * 2)
-                rect.center = (C, C)
-                for w, a in ((12, 60), (20, 35)):
-                    pygame.draw.arc(l3, (*hi, a), rect.inflate(w, w), 0, math.pi * 1.65, 8)
+                def build_l3(l3: pygame.Surface) -> None:
+                    rect = pygame.Rect(0, 0, r * 2, r * 2)
+                    rect.center = (C, C)
+                    for w, a in ((12, 60), (20, 35)):
+                        pygame.draw.arc(l3, (*hi, a), rect.inflate(w, w), 0, math.pi * 1.65, 8)
+
+                l3 = self._layer(("l3",) + geo, side, build_l3)
+                layers.append(l3)
                 layers.append(l3)
 
             if g.level >= 4:
-                l4 = new_layer()
+                l4 = self._scratch("l4", side)
                 orbit_r = int(r * 1.15)
-                for k in range(3):
-                    ang = t * 1.4 + k * (2 * math.pi / 3)
-                    x = int(C + math.cos(ang) * orbit_r)
-                    y = int(C + math.sin(ang) * orbit_r)
+                ca, sa = math.cos(t * 1.4), math.sin(t * 1.4)
+                for ck, sk in _ORBIT_OFFSETS:
+                    x = int(C + (ca * ck - sa * sk) * orbit_r)
+                    y = int(C + (sa * ck + ca * sk) * orbit_r)
                     pygame.draw.circle(l4, (*base, 170), (x, y), 3)
                 layers.append(l4)
+                layers.append(l4)
 
             if g.level >= 5:
-                l5 = new_layer()
-                self._dashed_ring(l5, C, int(r * 1.20), dash_deg=16, gap_deg=10, width=3, alpha=150, color=base)
-                l5 = pygame.transform.rotozoom(l5, rot_ccw_deg * 0.8, 1.0)
+                def build_l5(l5: pygame.Surface) -> None:
+                    self._dashed_ring(l5, C, int(r * 1.20), dash_deg=16, gap_deg=10, width=3, alpha=150, color=base)
+
+                l5 = self._layer(("l5",) + geo, side, build_l5)
                 layers.append(l5)
+                spin = self._scratch("l5_spin", side)
+                self._dashed_ring(
+                    spin, C, int(r * 1.20), dash_deg=16, gap_deg=10, width=3, alpha=150, color=base,
+                    start_deg=rot_ccw_deg * 0.8,
+                )
+                layers.append(spin)
 
             for layer in layers:
                 blit_to_out(layer)
@@ -103,7 +158,10 @@ class InputRing:
 
         if icons_visible:
             icon_size = int(base_size * RING_ICON_SIZE_FACTOR)
-            pos_xy = {"TOP": (cx, cy - r), "RIGHT": (cx + r, cy), "LEFT": (cx - r, cy), "BOTTOM": (cx, cy + r)}
+            if g._ring_key == ((cx, cy), base_size):
+                pos_xy = g._ring_pos
+            else:
+                pos_xy = {"TOP": (cx, cy - r), "RIGHT": (cx + r, cy), "LEFT": (cx - r, cy), "BOTTOM": (cx, cy + r)}
             active_layout = layout if layout is not None else g.ring_layout
             for pos, (ix, iy) in pos_xy.items():
                 name = active_layout.get(pos, DEFAULT_RING_LAYOUT[pos])
@@ -120,7 +178,7 @@ class InputRing:
         if abs(spin_deg) > 0.0001:
             out = pygame.transform.rotozoom(out, spin_deg, 1.0)
 
-        self.g.screen.blit(out, out.get_rect(center=(cx, cy)))
+        g._dirty_rects.append(g.screen.blit(out, out.get_rect(center=(cx, cy))))
 
     def _dashed_ring(
         self,
@@ -133,16 +191,15 @@ class InputRing:
         width: int,
         alpha: int,
         color: tuple[int, int, int],
+        start_deg: float = 0.0,
     ) -> None:
-        total_deg = 360
-        angle = 0.0
+        # start_deg turns the pattern counter-clockwise, like rotozoom with a positive angle
         rect = pygame.Rect(0, 0, radius * 2, radius * 2)
         rect.center = (center, center)
-        while angle < total_deg:
-            start = math.radians(angle)
-            end = math.radians(min(total_deg, angle + dash_deg))
-            pygame.draw.arc(surface, (*color, alpha), rect, start, end, width)
-            angle += dash_deg + gap_deg
+        col = (*color, alpha)
+        off = math.radians(start_deg)
+        for start, end in _dash_segments(dash_deg, gap_deg):
+            pygame.draw.arc(surface, col, rect, start + off, end + off, width)
 
 
 class TimeBar:
@@ -194,13 +251,15 @@ class TimeBar:
             bar_h + TIMER_POSITION_INDICATOR_PAD * 2,
         )
         pygame.draw.rect(g.screen, ACCENT, indicator_rect)
+        dirty = pygame.Rect(bar_x, bar_y, bar_w, bar_h).union(indicator_rect)
 
         if label:
-            timer_font = getattr(g, "timer_font", g.mid)
-            surf = g.draw_text(label, color=TIMER_BAR_TEXT_COLOR, font=timer_font, shadow=True, glitch=False)
+            timer_font = g.timer_font
+            surf = g.draw_text(label, color=TIMER_BAR_TEXT_COLOR, font=timer_font, shadow=True, glitch=False, atlas=True)
             tx = bar_x + (bar_w - surf.get_width()) // 2
             ty = bar_y - surf.get_height() - TIMER_LABEL_GAP
-            g.screen.blit(surf, (tx, ty))
+            dirty.union_ip(g.screen.blit(surf, (tx, ty)))
+        g._dirty_rects.append(dirty)
 
 
 class PausableCountdown: